@@ -4,11 +4,15 @@ Contains base adapter and specific API adapters for various data sources.
 """
 
 from .base import BaseAdapter
+from .async_base import AsyncBaseAdapter
+from .cache import ResponseCache
 from .etherscan import EtherscanAdapter
 from .zerion import ZerionAdapter
 
 __all__ = [
     'BaseAdapter',
+    'AsyncBaseAdapter',
+    'ResponseCache',
     'EtherscanAdapter',
     'ZerionAdapter'
 ] 
\ No newline at end of file
@@ -0,0 +1,47 @@
+"""
+Columnar conversion of explorer API results.
+
+Turns the "result" list-of-dicts returned by Etherscan into a typed Arrow
+table so filters and aggregations can run on Arrow compute kernels.
+"""
+
+from decimal import Decimal
+from typing import Any, Dict, List
+
+import pyarrow as pa
+
+from utils.convert import parse_wei
+
+TX_SCHEMA = pa.schema(
+    [
+        ("hash", pa.string()),
+        ("from", pa.dictionary(pa.int32(), pa.string())),
+        ("to", pa.dictionary(pa.int32(), pa.string())),
+        ("value", pa.decimal128(38, 0)),
+        ("gas", pa.uint64()),
+        ("timeStamp", pa.timestamp("s")),
+    ]
+)
+
+
+def to_arrow(rows: List[Dict[str, Any]]) -> pa.Table:
+    """
+    Convert transaction dictionaries into a table with TX_SCHEMA.
+
+    Args:
+        rows: Transaction dictionaries from an Etherscan "result" array
+
+    Returns:
+        Arrow table with one row per transaction
+    """
+    columns = [
+        pa.array([row.get("hash") for row in rows], pa.string()),
+        pa.array([row.get("from") for row in rows], pa.string()).dictionary_encode(),
+        pa.array([row.get("to") for row in rows], pa.string()).dictionary_encode(),
+        pa.array(
+            [Decimal(parse_wei(row.get("value"))) for row in rows], pa.decimal128(38, 0)
+        ),
+        pa.array([parse_wei(row.get("gas")) for row in rows], pa.uint64()),
+        pa.array([parse_wei(row.get("timeStamp")) for row in rows], pa.timestamp("s")),
+    ]
+    return pa.Table.from_arrays(columns, schema=TX_SCHEMA)
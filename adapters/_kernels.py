@@ -0,0 +1,37 @@
+"""
+Compiled kernels for transaction aggregation.
+
+Operates on column arrays (SoA) extracted from explorer API results so the
+per-row arithmetic runs in native code rather than the interpreter.
+"""
+
+from numba import njit, prange
+
+
+@njit(cache=True, parallel=True)
+def aggregate_flows(from_ids, to_ids, values, self_id):
+    """
+    Sum inflow/outflow and count transactions touching an address.
+
+    Args:
+        from_ids: int64 array of label-encoded sender addresses
+        to_ids: int64 array of label-encoded recipient addresses
+        values: float64 array of transferred amounts (wei)
+        self_id: Label-encoded id of the address being analyzed
+
+    Returns:
+        Tuple of (inflow, outflow, transaction_count)
+    """
+    inflow = 0.0
+    outflow = 0.0
+    count = 0
+    for i in prange(values.shape[0]):
+        incoming = to_ids[i] == self_id
+        outgoing = from_ids[i] == self_id
+        if incoming:
+            inflow += values[i]
+        if outgoing:
+            outflow += values[i]
+        if incoming or outgoing:
+            count += 1
+    return inflow, outflow, count
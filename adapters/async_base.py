@@ -0,0 +1,473 @@
+#!/usr/bin/env python3
+"""
+Async Base Adapter for Data Source Integrations
+An aiohttp-based foundation for API adapters whose calls can run concurrently.
+"""
+
+import os
+import asyncio
+import aiohttp
+import ijson
+import orjson
+from functools import lru_cache
+from typing import Dict, Optional, Any, List, Tuple, AsyncIterator
+from dotenv import load_dotenv
+from abc import ABC, abstractmethod
+
+from .cache import ResponseCache
+
+# Load environment variables from .env file
+load_dotenv()
+
+
+# Headers sent on every request; compressed JSON cuts transfer size several-fold
+DEFAULT_HEADERS = {
+    "Accept": "application/json",
+    "Accept-Encoding": "gzip, deflate, br",
+}
+
+
+# Connector shared by the adapters on each event loop, with its session count
+_SHARED_CONNECTORS: Dict[asyncio.AbstractEventLoop, list] = {}
+
+
+def _release_connector(
+    loop: asyncio.AbstractEventLoop,
+) -> Optional[aiohttp.TCPConnector]:
+    """Drop one session's reference; return the connector if it is now unused."""
+    entry = _SHARED_CONNECTORS.get(loop)
+    if entry is None:
+        return None
+    entry[1] -= 1
+    if entry[1] > 0:
+        return None
+    del _SHARED_CONNECTORS[loop]
+    return entry[0]
+
+
+@lru_cache(maxsize=64)
+def _join_url(base_url: str, endpoint: str) -> str:
+    """Join a pre-stripped base URL and an endpoint."""
+    endpoint = endpoint.lstrip("/")
+    return f"{base_url}/{endpoint}" if endpoint else base_url
+
+
+class AsyncBaseAdapter(ABC):
+    """Async base adapter class for API integrations with common functionality."""
+
+    __slots__ = (
+        "base_url",
+        "headers",
+        "timeout",
+        "max_retries",
+        "_base_url_stripped",
+        "_client_timeout",
+        "_session",
+        "_session_loop",
+        "_owns_session",
+        "_cache",
+    )
+
+    # Default cache TTL in seconds for responses that may change ("latest" data)
+    DEFAULT_CACHE_EXPIRY = 10
+
+    # Shared connection pool sizing and keep-alive for bursts of concurrent
+    # requests (long enough for Zerion's slow responses)
+    POOL_LIMIT = 64
+    POOL_LIMIT_PER_HOST = 32
+    KEEPALIVE_TIMEOUT = 120
+
+    # Request headers that select different data, so they are part of the
+    # persistent cache key
+    CACHE_KEY_HEADERS: Tuple[str, ...] = ()
+
+    # Transient failures retried with exponential backoff
+    RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+    BACKOFF_FACTOR = 0.3
+
+    # Longest server-requested Retry-After wait honored, in seconds
+    MAX_RETRY_AFTER = 30
+
+    def __init__(
+        self,
+        base_url: str = None,
+        headers: Dict[str, str] = None,
+        timeout: int = 30,
+        cache_path: str = None,
+    ):
+        """
+        Initialize the async base adapter.
+
+        Args:
+            base_url: Base URL for API endpoints
+            headers: Default headers for requests
+            timeout: Request timeout in seconds
+            cache_path: SQLite file for the persistent response cache
+                (can also be set via ADAPTER_CACHE_PATH env var; disabled if unset)
+        """
+        self.base_url = base_url or ""
+        self.headers = {**DEFAULT_HEADERS, **(headers or {})}
+        self.timeout = timeout
+        self.max_retries = int(os.getenv("MAX_RETRIES", "3"))
+        self._base_url_stripped = self.base_url.rstrip("/")
+        self._client_timeout = aiohttp.ClientTimeout(total=timeout)
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._session_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._owns_session = True
+
+        cache_path = cache_path or os.getenv("ADAPTER_CACHE_PATH")
+        self._cache: Optional[ResponseCache] = (
+            ResponseCache(cache_path) if cache_path else None
+        )
+
+    async def __aenter__(self):
+        """Async context manager entry."""
+        await self._ensure_session()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Async context manager exit."""
+        await self.aclose()
+
+    def use_session(self, session: aiohttp.ClientSession) -> None:
+        """
+        Send requests through an externally managed session.
+
+        The adapter never closes a borrowed session; aclose() only detaches it.
+        Headers and timeouts are applied per request, so one session can serve
+        adapters with different credentials. Call before issuing requests.
+
+        Args:
+            session: Open aiohttp session owned by the caller
+        """
+        self._session = session
+        self._session_loop = None
+        self._owns_session = False
+
+    async def _ensure_session(self) -> aiohttp.ClientSession:
+        """Create the HTTP session lazily, bound to the running event loop."""
+        if not self._owns_session:
+            if self._session is not None and not self._session.closed:
+                return self._session
+            # The borrowed session is gone; fall back to an own session
+            self._session = None
+            self._owns_session = True
+
+        loop = asyncio.get_running_loop()
+        if (
+            self._session is None
+            or self._session.closed
+            or self._session_loop is not loop
+        ):
+            if self._session is not None and self._session_loop is not None:
+                # Drop the old session's hold on its loop's connector, so a
+                # finished loop is not kept alive by the shared registry
+                _release_connector(self._session_loop)
+            self._session = aiohttp.ClientSession(
+                connector=self._acquire_connector(loop),
+                connector_owner=False,
+                json_serialize=lambda obj: orjson.dumps(obj).decode(),
+            )
+            self._session_loop = loop
+        return self._session
+
+    @classmethod
+    def create_connector(cls) -> aiohttp.TCPConnector:
+        """
+        Create a connection pool with the adapters' pool settings.
+
+        Sessions opened outside the adapters (e.g. one shared by a whole batch)
+        use this so every pool has the same limits and keep-alive.
+        """
+        return aiohttp.TCPConnector(
+            limit=cls.POOL_LIMIT,
+            limit_per_host=cls.POOL_LIMIT_PER_HOST,
+            keepalive_timeout=cls.KEEPALIVE_TIMEOUT,
+            ttl_dns_cache=300,
+        )
+
+    def _acquire_connector(
+        self, loop: asyncio.AbstractEventLoop
+    ) -> aiohttp.TCPConnector:
+        """
+        Return the connector shared by all adapters on a loop, creating it if needed.
+
+        Sharing one pool lets adapters reuse each other's DNS cache entries and
+        keep-alive connections. The first adapter to open a session sizes it.
+        """
+        entry = _SHARED_CONNECTORS.get(loop)
+        if entry is None or entry[0].closed:
+            entry = _SHARED_CONNECTORS[loop] = [self.create_connector(), 0]
+        entry[1] += 1
+        return entry[0]
+
+    async def aclose(self) -> None:
+        """
+        Close the HTTP session, and the shared connector once no session uses it.
+
+        A borrowed session (see use_session) is detached, not closed. The
+        response cache's database connection is closed too; it reopens if the
+        adapter is used again.
+        """
+        if self._cache:
+            self._cache.close()
+
+        session, loop = self._session, self._session_loop
+        self._session = None
+        self._session_loop = None
+        if not self._owns_session:
+            self._owns_session = True
+            return
+        if session is None:
+            return
+        connector = _release_connector(loop)
+        if loop is not asyncio.get_running_loop():
+            # Sockets of another loop cannot be closed from this one
+            return
+        if not session.closed:
+            await session.close()
+        if connector is not None:
+            await connector.close()
+
+    async def get(
+        self, endpoint: str, params: Dict[str, Any] = None
+    ) -> Optional[Dict]:
+        """
+        Perform a GET request to the specified endpoint.
+
+        Args:
+            endpoint: API endpoint (will be appended to base_url)
+            params: Query parameters
+
+        Returns:
+            JSON response as dictionary or None if failed
+        """
+        url = self._build_url(endpoint)
+
+        cache_key = None
+        if self._cache:
+            cache_key = self._cache.make_key(
+                url,
+                params,
+                {
+                    name: self.headers[name]
+                    for name in self.CACHE_KEY_HEADERS
+                    if name in self.headers
+                },
+            )
+            # SQLite calls block, so they run off the event loop
+            cached = await asyncio.to_thread(self._cache.get, cache_key)
+            if cached is not None:
+                return cached
+
+        try:
+            data = await self._request("GET", url, params=params)
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            self._handle_error(f"Error fetching data from {url}: {e}")
+            return None
+        except orjson.JSONDecodeError as e:
+            self._handle_error(f"Error parsing JSON response: {e}")
+            return None
+
+        if cache_key and self._is_cacheable(data):
+            await asyncio.to_thread(
+                self._cache.set,
+                cache_key,
+                data,
+                self._expiry_for(endpoint, params or {}),
+            )
+        return data
+
+    async def iter_result(
+        self, endpoint: str, params: Dict[str, Any] = None, prefix: str = "result.item"
+    ) -> AsyncIterator[Any]:
+        """
+        Stream items from a GET response without materializing the whole body.
+
+        Args:
+            endpoint: API endpoint (will be appended to base_url)
+            params: Query parameters
+            prefix: ijson prefix of the items to yield (default: the "result" array)
+
+        Yields:
+            Parsed items as they arrive
+        """
+        url = self._build_url(endpoint)
+        try:
+            session = await self._ensure_session()
+            async with session.get(
+                url,
+                params=params,
+                headers=self.headers,
+                timeout=self._client_timeout,
+            ) as response:
+                response.raise_for_status()
+                async for item in ijson.items(response.content, prefix):
+                    yield item
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            self._handle_error(f"Error streaming data from {url}: {e}")
+        except ijson.JSONError as e:
+            self._handle_error(f"Error parsing streamed JSON response: {e}")
+
+    async def get_many(
+        self, requests_list: List[Tuple[str, Dict[str, Any]]]
+    ) -> List[Optional[Dict]]:
+        """
+        Perform several GET requests concurrently over the shared session.
+
+        Args:
+            requests_list: List of (endpoint, params) pairs
+
+        Returns:
+            List of JSON responses (or None for failed requests), in request order
+        """
+        return await asyncio.gather(
+            *(self.get(endpoint, params=params) for endpoint, params in requests_list)
+        )
+
+    async def post(
+        self,
+        endpoint: str,
+        data: Dict[str, Any] = None,
+        json_data: Dict[str, Any] = None,
+    ) -> Optional[Dict]:
+        """
+        Perform a POST request to the specified endpoint.
+
+        Args:
+            endpoint: API endpoint
+            data: Form data to send
+            json_data: JSON data to send
+
+        Returns:
+            JSON response as dictionary or None if failed
+        """
+        url = self._build_url(endpoint)
+        try:
+            return await self._request("POST", url, data=data, json=json_data)
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            self._handle_error(f"Error posting data to {url}: {e}")
+            return None
+        except orjson.JSONDecodeError as e:
+            self._handle_error(f"Error parsing JSON response: {e}")
+            return None
+
+    async def _request(self, method: str, url: str, **kwargs) -> Any:
+        """
+        Send a request, retrying transient failures, and decode the JSON body.
+
+        HTTP errors are handled by status code rather than exceptions: retryable
+        statuses back off (honoring Retry-After on 429/503) and others return None.
+
+        Raises:
+            aiohttp.ClientError, asyncio.TimeoutError: once retries are exhausted
+            orjson.JSONDecodeError: if the body is not valid JSON
+        """
+        session = await self._ensure_session()
+        for attempt in range(self.max_retries + 1):
+            try:
+                async with session.request(
+                    method,
+                    url,
+                    headers=self.headers,
+                    timeout=self._client_timeout,
+                    **kwargs,
+                ) as response:
+                    status = response.status
+                    if status < 400:
+                        return orjson.loads(await response.read())
+                    if status not in self.RETRY_STATUSES or attempt >= self.max_retries:
+                        self._handle_error(f"HTTP {status} {response.reason} for {url}")
+                        return None
+                    retry_after = response.headers.get("Retry-After")
+                    delay = self._retry_delay(attempt, retry_after)
+            except (aiohttp.ClientConnectionError, asyncio.TimeoutError):
+                if attempt >= self.max_retries:
+                    raise
+                delay = self._retry_delay(attempt)
+            await asyncio.sleep(delay)
+
+    def _retry_delay(self, attempt: int, retry_after: Optional[str] = None) -> float:
+        """
+        Seconds to wait before the next attempt.
+
+        A numeric Retry-After from the server is preferred, capped at
+        MAX_RETRY_AFTER so one response cannot stall the caller for long;
+        otherwise the delay backs off exponentially.
+        """
+        if retry_after:
+            try:
+                return min(max(0.0, float(retry_after)), self.MAX_RETRY_AFTER)
+            except ValueError:
+                pass  # HTTP-date form; fall back to exponential backoff
+        return self.BACKOFF_FACTOR * 2**attempt
+
+    # === Sync Facade ===
+
+    def get_sync(self, endpoint: str, params: Dict[str, Any] = None) -> Optional[Dict]:
+        """Blocking wrapper around get() for callers without an event loop."""
+        return asyncio.run(self._run_and_close(self.get(endpoint, params=params)))
+
+    def post_sync(
+        self,
+        endpoint: str,
+        data: Dict[str, Any] = None,
+        json_data: Dict[str, Any] = None,
+    ) -> Optional[Dict]:
+        """Blocking wrapper around post() for callers without an event loop."""
+        return asyncio.run(
+            self._run_and_close(self.post(endpoint, data=data, json_data=json_data))
+        )
+
+    async def _run_and_close(self, coro):
+        """Await a coroutine and close the session created for it."""
+        try:
+            return await coro
+        finally:
+            await self.aclose()
+
+    def _expiry_for(self, endpoint: str, params: Dict[str, Any]) -> Optional[float]:
+        """
+        Return the cache TTL for a GET request. Can be overridden by subclasses.
+
+        Returns:
+            TTL in seconds, NEVER_EXPIRE (None), or DO_NOT_CACHE (0)
+        """
+        return self.DEFAULT_CACHE_EXPIRY
+
+    def _is_cacheable(self, response: Any) -> bool:
+        """Check whether a response may be cached. Can be overridden by subclasses."""
+        return response is not None
+
+    def _build_url(self, endpoint: str) -> str:
+        """Build full URL from base URL and endpoint."""
+        return _join_url(self._base_url_stripped, endpoint)
+
+    def _handle_error(self, message: str) -> None:
+        """Handle error messages. Can be overridden by subclasses."""
+        print(message)
+
+    @abstractmethod
+    async def authenticate(self) -> bool:
+        """
+        Authenticate with the API service.
+        Must be implemented by subclasses.
+
+        Returns:
+            True if authentication successful, False otherwise
+        """
+        pass
+
+    @abstractmethod
+    def validate_response(self, response: Dict[str, Any]) -> bool:
+        """
+        Validate API response format.
+        Must be implemented by subclasses.
+
+        Args:
+            response: API response dictionary
+
+        Returns:
+            True if response is valid, False otherwise
+        """
+        pass
@@ -5,7 +5,7 @@ A foundational class for creating specific API adapters.
 """
 
 import os
-import json
+import orjson
 import requests
 from typing import Dict, Optional, Any, List
 from dotenv import load_dotenv
@@ -18,6 +18,8 @@ load_dotenv()
 class BaseAdapter(ABC):
     """Base adapter class for API integrations with common functionality."""
 
+    __slots__ = ("base_url", "headers", "timeout", "session")
+
     def __init__(
         self, base_url: str = None, headers: Dict[str, str] = None, timeout: int = 30
     ):
@@ -53,11 +55,11 @@ class BaseAdapter(ABC):
             url = self._build_url(endpoint)
             response = self.session.get(url, params=params, timeout=self.timeout)
             response.raise_for_status()
-            return response.json()
+            return orjson.loads(response.content)
         except requests.exceptions.RequestException as e:
             self._handle_error(f"Error fetching data from {url}: {e}")
             return None
-        except json.JSONDecodeError as e:
+        except orjson.JSONDecodeError as e:
             self._handle_error(f"Error parsing JSON response: {e}")
             return None
 
@@ -80,15 +82,19 @@ class BaseAdapter(ABC):
         """
         try:
             url = self._build_url(endpoint)
+            headers = None
+            if json_data is not None:
+                data = orjson.dumps(json_data)
+                headers = {"Content-Type": "application/json"}
             response = self.session.post(
-                url, data=data, json=json_data, timeout=self.timeout
+                url, data=data, headers=headers, timeout=self.timeout
             )
             response.raise_for_status()
-            return response.json()
+            return orjson.loads(response.content)
         except requests.exceptions.RequestException as e:
             self._handle_error(f"Error posting data to {url}: {e}")
             return None
-        except json.JSONDecodeError as e:
+        except orjson.JSONDecodeError as e:
             self._handle_error(f"Error parsing JSON response: {e}")
             return None
 
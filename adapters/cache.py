@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""
+Persistent Response Cache
+A small SQLite-backed cache for JSON API responses keyed by (url, params).
+"""
+
+import time
+import sqlite3
+import threading
+import orjson
+from urllib.parse import urlencode
+from typing import Dict, Optional, Any, Iterable
+
+# Sentinel TTL values for ResponseCache.set()
+NEVER_EXPIRE = None
+DO_NOT_CACHE = 0
+
+
+class ResponseCache:
+    """
+    On-disk cache for idempotent API responses with per-entry expiry.
+
+    Calls are serialized by a lock, so one cache can be used from worker
+    threads (e.g. via asyncio.to_thread). The connection is opened on first
+    use and reopened after close().
+    """
+
+    def __init__(self, path: str, ignored_parameters: Iterable[str] = ("apikey",)):
+        """
+        Initialize the response cache.
+
+        Args:
+            path: SQLite database file path
+            ignored_parameters: Query parameters excluded from cache keys
+        """
+        self.path = path
+        self.ignored_parameters = frozenset(ignored_parameters)
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+
+    def _connection(self) -> sqlite3.Connection:
+        """Return the open database connection, opening it if needed."""
+        if self._conn is None:
+            self._conn = sqlite3.connect(self.path, check_same_thread=False)
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS responses "
+                "(key TEXT PRIMARY KEY, expires_at REAL, body BLOB NOT NULL)"
+            )
+            self._conn.commit()
+        return self._conn
+
+    def make_key(
+        self,
+        url: str,
+        params: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> str:
+        """
+        Build a cache key from the URL, query parameters and data-selecting headers.
+
+        Args:
+            url: Request URL
+            params: Query parameters
+            headers: Headers that change the response (e.g. an environment
+                selector); omitted from the key when empty
+
+        Returns:
+            Cache key string
+        """
+        items = sorted(
+            (key, str(value))
+            for key, value in (params or {}).items()
+            if key not in self.ignored_parameters
+        )
+        key = f"{url}?{urlencode(items)}"
+        if headers:
+            key += f"#{urlencode(sorted(headers.items()))}"
+        return key
+
+    def get(self, key: str) -> Optional[Any]:
+        """Return the cached response for key, or None if missing or expired."""
+        with self._lock:
+            conn = self._connection()
+            row = conn.execute(
+                "SELECT expires_at, body FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+
+            expires_at, body = row
+            if expires_at is not None and expires_at < time.time():
+                conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+                conn.commit()
+                return None
+
+        return orjson.loads(body)
+
+    def set(self, key: str, value: Any, expire_after: Optional[float]) -> None:
+        """
+        Store a response.
+
+        Args:
+            key: Cache key from make_key()
+            value: JSON-serializable response
+            expire_after: TTL in seconds, NEVER_EXPIRE, or DO_NOT_CACHE
+        """
+        if expire_after == DO_NOT_CACHE:
+            return
+
+        expires_at = None if expire_after is None else time.time() + expire_after
+        body = orjson.dumps(value)
+        with self._lock:
+            conn = self._connection()
+            conn.execute(
+                "INSERT OR REPLACE INTO responses (key, expires_at, body) "
+                "VALUES (?, ?, ?)",
+                (key, expires_at, body),
+            )
+            conn.commit()
+
+    def close(self) -> None:
+        """Close the underlying database connection (reopened on next use)."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
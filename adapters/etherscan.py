@@ -6,12 +6,64 @@ Documentation: https://docs.etherscan.io/etherscan-v2/api-endpoints/accounts
 """
 
 import os
-from typing import Dict, Optional, Any, List, Union
-from .base import BaseAdapter
+import time
+import asyncio
+import numpy as np
+from cachetools import TTLCache
+from typing import Dict, Optional, Any, List, Set, Union, AsyncIterator, TYPE_CHECKING
+from .async_base import AsyncBaseAdapter
+from .cache import NEVER_EXPIRE
+from utils.convert import parse_wei, safe_wei_to_eth, wei_to_eth, WEI_PER_ETH
+
+if TYPE_CHECKING:
+    import pyarrow as pa
+
+# Actions of the "account" module used by this adapter
+_ACCOUNT_ACTIONS = (
+    "balance",
+    "balancemulti",
+    "balancehistory",
+    "txlist",
+    "txlistinternal",
+    "tokentx",
+    "tokennfttx",
+    "token1155tx",
+    "fundedby",
+)
+
+
+def _address_id(address_ids: Dict[str, int], address: str) -> int:
+    """Return the integer id of an address in a label encoding (case-insensitive)."""
+    return address_ids.setdefault(address.lower(), len(address_ids))
+
+
+class EtherscanAdapter(AsyncBaseAdapter):
+    """Adapter for Etherscan API v2 to fetch Ethereum blockchain data."""
 
+    __slots__ = (
+        "api_key",
+        "chain_id",
+        "_base_params",
+        "_account_base_params",
+        "_pending_balances",
+        "_balance_batches",
+        "_memo",
+        "_inflight",
+    )
 
-class EtherscanAdapter(BaseAdapter):
-    """Adapter for Etherscan API v2 to fetch Ethereum blockchain data."""
+    # Etherscan free-tier rate limit (requests per second)
+    RATE_LIMIT = 5
+
+    # Rows Etherscan serves per query; page * offset may not exceed this
+    MAX_RESULT_WINDOW = 10000
+
+    # In-process memo of successful responses (entries, seconds)
+    MEMO_SIZE = 1024
+    MEMO_TTL = 60
+
+    # Coalescing window (seconds) and batch size for balance lookups
+    BALANCE_BATCH_WINDOW = 0.01
+    BALANCE_BATCH_SIZE = 20
 
     def __init__(self, api_key: str = None, chain_id: int = 1):
         """
@@ -29,10 +81,29 @@ class EtherscanAdapter(BaseAdapter):
                 "Etherscan API key is required. Set ETHERSCAN_API_KEY env var or pass api_key parameter."
             )
 
+        # Parameters shared by every request, copied into each call's params
+        self._base_params = {"chainid": self.chain_id, "apikey": self.api_key}
+
+        # Constant part of each account endpoint's parameters, built once
+        self._account_base_params = {
+            action: {**self._base_params, "module": "account", "action": action}
+            for action in _ACCOUNT_ACTIONS
+        }
+
+        # Balance lookups waiting to be coalesced, keyed by tag then address
+        self._pending_balances: Dict[str, Dict[str, asyncio.Future]] = {}
+
+        # Running balance batch tasks, referenced until they finish
+        self._balance_batches: Set[asyncio.Task] = set()
+        self._memo: TTLCache = TTLCache(maxsize=self.MEMO_SIZE, ttl=self.MEMO_TTL)
+
+        # Requests currently on the wire, shared by identical concurrent calls
+        self._inflight: Dict[tuple, asyncio.Task] = {}
+
         # Initialize base adapter with Etherscan API URL
         super().__init__(base_url="https://api.etherscan.io/v2/api", timeout=30)
 
-    def authenticate(self) -> bool:
+    async def authenticate(self) -> bool:
         """
         Authenticate with Etherscan API by testing a simple endpoint.
 
@@ -41,7 +112,7 @@ class EtherscanAdapter(BaseAdapter):
         """
         try:
             # Test authentication with a simple balance check
-            response = self.get_ether_balance(
+            response = await self.get_ether_balance(
                 "0x0000000000000000000000000000000000000000"
             )
             return response is not None and self.validate_response(response)
@@ -66,15 +137,73 @@ class EtherscanAdapter(BaseAdapter):
         # Check for typical Etherscan response structure
         return "status" in response and "message" in response and "result" in response
 
+    def _expiry_for(self, endpoint: str, params: Dict[str, Any]) -> Optional[float]:
+        """Cache historical lookups forever; everything else uses the short default."""
+        action = params.get("action")
+        if action == "balancehistory":
+            # Balance at a fixed block number never changes
+            return NEVER_EXPIRE
+        if action == "txlistinternal" and "txhash" in params:
+            # Internal transactions of a mined transaction never change
+            return NEVER_EXPIRE
+        return self.DEFAULT_CACHE_EXPIRY
+
+    def _is_cacheable(self, response: Any) -> bool:
+        """Only cache successful responses (rate-limit errors come back as HTTP 200)."""
+        return isinstance(response, dict) and response.get("status") == "1"
+
+    async def get(
+        self, endpoint: str, params: Dict[str, Any] = None
+    ) -> Optional[Dict]:
+        """
+        Perform a GET request, serving repeats within MEMO_TTL from memory.
+
+        Identical requests issued while one is already on the wire await that
+        request instead of sending their own.
+
+        Args:
+            endpoint: API endpoint (will be appended to base_url)
+            params: Query parameters
+
+        Returns:
+            JSON response as dictionary or None if failed
+        """
+        key = (endpoint, tuple(sorted((params or {}).items())))
+        cached = self._memo.get(key)
+        if cached is not None:
+            return cached
+
+        request = self._inflight.get(key)
+        if request is None:
+            request = asyncio.ensure_future(super().get(endpoint, params=params))
+            self._inflight[key] = request
+            request.add_done_callback(lambda done: self._finish_request(key, done))
+
+        # Shielded so one caller's cancellation does not cancel the shared request
+        return await asyncio.shield(request)
+
+    def _finish_request(self, key: tuple, request: asyncio.Task) -> None:
+        """Retire a completed shared request, memoizing a successful response."""
+        self._inflight.pop(key, None)
+        if request.cancelled() or request.exception() is not None:
+            return
+        response = request.result()
+        if self._is_cacheable(response):
+            self._memo[key] = response
+
     def _build_params(self, **kwargs) -> Dict[str, Any]:
         """Build common parameters for Etherscan API requests."""
-        params = {"chainid": self.chain_id, "apikey": self.api_key}
-        params.update(kwargs)
-        return params
+        return {**self._base_params, **kwargs}
+
+    def _account_params(self, action: str, **kwargs) -> Dict[str, Any]:
+        """Build parameters for an account module action from its prebuilt base."""
+        return {**self._account_base_params[action], **kwargs}
 
     # === Balance Endpoints ===
 
-    def get_ether_balance(self, address: str, tag: str = "latest") -> Optional[Dict]:
+    async def get_ether_balance(
+        self, address: str, tag: str = "latest"
+    ) -> Optional[Dict]:
         """
         Get Ether balance for a single address.
 
@@ -85,12 +214,10 @@ class EtherscanAdapter(BaseAdapter):
         Returns:
             Balance data or None if failed
         """
-        params = self._build_params(
-            module="account", action="balance", address=address, tag=tag
-        )
-        return self.get("", params=params)
+        params = self._account_params("balance", address=address, tag=tag)
+        return await self.get("", params=params)
 
-    def get_ether_balance_multi(
+    async def get_ether_balance_multi(
         self, addresses: List[str], tag: str = "latest"
     ) -> Optional[Dict]:
         """
@@ -106,15 +233,93 @@ class EtherscanAdapter(BaseAdapter):
         if len(addresses) > 20:
             raise ValueError("Maximum 20 addresses allowed per call")
 
-        params = self._build_params(
-            module="account",
-            action="balancemulti",
+        params = self._account_params(
+            "balancemulti",
             address=",".join(addresses),
             tag=tag,
         )
-        return self.get("", params=params)
+        return await self.get("", params=params)
+
+    async def get_ether_balance_coalesced(
+        self, address: str, tag: str = "latest"
+    ) -> Optional[Dict]:
+        """
+        Get Ether balance for a single address, batching concurrent lookups.
+
+        Lookups issued within BALANCE_BATCH_WINDOW of each other are sent as one
+        balancemulti call (up to BALANCE_BATCH_SIZE addresses). The response has
+        the same shape as get_ether_balance().
+
+        Args:
+            address: Ethereum address to check balance for
+            tag: Block parameter ('earliest', 'pending', or 'latest')
 
-    def get_historical_ether_balance(
+        Returns:
+            Balance data or None if failed
+        """
+        batch = self._pending_balances.get(tag)
+        if batch is None:
+            # The batch is sent from its own task rather than the first caller,
+            # so cancelling any one caller does not fail the others' lookups
+            batch = self._pending_balances[tag] = {}
+            task = asyncio.ensure_future(self._send_balance_batch(batch, tag))
+            self._balance_batches.add(task)
+            task.add_done_callback(self._balance_batches.discard)
+
+        key = address.lower()
+        future = batch.get(key)
+        if future is None:
+            future = batch[key] = asyncio.get_running_loop().create_future()
+
+        # A full batch stops accepting lookups; later callers start a new one
+        if (
+            len(batch) >= self.BALANCE_BATCH_SIZE
+            and self._pending_balances.get(tag) is batch
+        ):
+            del self._pending_balances[tag]
+
+        # Shielded so a cancelled caller leaves the shared future untouched
+        return await asyncio.shield(future)
+
+    async def _send_balance_batch(
+        self, batch: Dict[str, asyncio.Future], tag: str
+    ) -> None:
+        """Wait for the batch window to close, then resolve the batch's lookups."""
+        try:
+            await asyncio.sleep(self.BALANCE_BATCH_WINDOW)
+            if self._pending_balances.get(tag) is batch:
+                del self._pending_balances[tag]
+            await self._resolve_balance_batch(batch, tag)
+        finally:
+            for pending in batch.values():
+                if not pending.done():
+                    pending.set_result(None)
+
+    async def _resolve_balance_batch(
+        self, batch: Dict[str, asyncio.Future], tag: str
+    ) -> None:
+        """Fetch the balances of a coalesced batch and resolve its futures."""
+        if len(batch) == 1:
+            address, future = next(iter(batch.items()))
+            future.set_result(await self.get_ether_balance(address, tag))
+            return
+
+        response = await self.get_ether_balance_multi(list(batch), tag)
+        if not response or not self.validate_response(response):
+            return
+
+        for entry in response.get("result") or []:
+            future = batch.get(str(entry.get("account", "")).lower())
+            if future is not None and not future.done():
+                future.set_result(
+                    {
+                        "status": response.get("status"),
+                        "message": response.get("message"),
+                        "result": entry.get("balance", "0"),
+                    }
+                )
+
+    async def get_historical_ether_balance(
         self, address: str, block_no: int
     ) -> Optional[Dict]:
         """
@@ -128,14 +333,14 @@ class EtherscanAdapter(BaseAdapter):
         Returns:
             Historical balance data or None if failed
         """
-        params = self._build_params(
-            module="account", action="balancehistory", address=address, blockno=block_no
+        params = self._account_params(
+            "balancehistory", address=address, blockno=block_no
         )
-        return self.get("", params=params)
+        return await self.get("", params=params)
 
     # === Transaction Endpoints ===
 
-    def get_normal_transactions(
+    async def get_normal_transactions(
         self,
         address: str,
         startblock: int = 0,
@@ -158,9 +363,76 @@ class EtherscanAdapter(BaseAdapter):
         Returns:
             Transaction list or None if failed
         """
-        params = self._build_params(
-            module="account",
-            action="txlist",
+        params = self._account_params(
+            "txlist",
+            address=address,
+            startblock=startblock,
+            endblock=endblock,
+            page=page,
+            offset=offset,
+            sort=sort,
+        )
+        return await self.get("", params=params)
+
+    async def get_normal_transactions_arrow(
+        self,
+        address: str,
+        startblock: int = 0,
+        endblock: int = 99999999,
+        page: int = 1,
+        offset: int = 10,
+        sort: str = "asc",
+    ) -> Optional["pa.Table"]:
+        """
+        Get normal transactions by address as a typed Arrow table.
+
+        Args:
+            address: Ethereum address to get transactions for
+            startblock: Starting block number
+            endblock: Ending block number
+            page: Page number for pagination
+            offset: Number of transactions per page
+            sort: Sort order ('asc' or 'desc')
+
+        Returns:
+            Arrow table with hash, from, to, value, gas and timeStamp columns,
+            or None if failed
+        """
+        # Imported lazily so pyarrow is only loaded when tables are requested
+        from ._arrow import to_arrow
+
+        response = await self.get_normal_transactions(
+            address, startblock, endblock, page, offset, sort
+        )
+        if not response or not isinstance(response.get("result"), list):
+            return None
+        return to_arrow(response["result"])
+
+    async def iter_normal_transactions(
+        self,
+        address: str,
+        startblock: int = 0,
+        endblock: int = 99999999,
+        page: int = 1,
+        offset: int = 10,
+        sort: str = "asc",
+    ) -> AsyncIterator[Dict]:
+        """
+        Stream normal transactions by address, one transaction at a time.
+
+        Args:
+            address: Ethereum address to get transactions for
+            startblock: Starting block number
+            endblock: Ending block number
+            page: Page number for pagination
+            offset: Number of transactions per page
+            sort: Sort order ('asc' or 'desc')
+
+        Yields:
+            Transaction dictionaries as they are parsed from the response
+        """
+        params = self._account_params(
+            "txlist",
             address=address,
             startblock=startblock,
             endblock=endblock,
@@ -168,9 +440,180 @@ class EtherscanAdapter(BaseAdapter):
             offset=offset,
             sort=sort,
         )
-        return self.get("", params=params)
+        async for tx in self.iter_result("", params=params):
+            yield tx
+
+    async def tx_stats(self, address: str, offset: int = 10000) -> Dict[str, Any]:
+        """
+        Aggregate inflow, outflow and transaction count for an address.
 
-    def get_internal_transactions(
+        Args:
+            address: Ethereum address to analyze
+            offset: Maximum number of transactions to aggregate
+
+        Returns:
+            Dictionary with inflow_eth, outflow_eth and transaction_count
+        """
+        # Imported lazily so numba is only loaded when stats are requested
+        from ._kernels import aggregate_flows
+
+        # Label encoding of addresses, only needed for the length of this call
+        address_ids: Dict[str, int] = {}
+        from_ids, to_ids, values = [], [], []
+        async for tx in self.iter_normal_transactions(address, offset=offset):
+            from_ids.append(_address_id(address_ids, tx.get("from") or ""))
+            to_ids.append(_address_id(address_ids, tx.get("to") or ""))
+            values.append(parse_wei(tx.get("value")))
+
+        inflow, outflow, count = aggregate_flows(
+            np.array(from_ids, dtype=np.int64),
+            np.array(to_ids, dtype=np.int64),
+            np.array(values, dtype=np.float64),
+            _address_id(address_ids, address),
+        )
+        return {
+            "inflow_eth": inflow / WEI_PER_ETH,
+            "outflow_eth": outflow / WEI_PER_ETH,
+            "transaction_count": int(count),
+        }
+
+    async def paginate_normal_transactions(
+        self,
+        address: str,
+        total_pages: int,
+        startblock: int = 0,
+        endblock: int = 99999999,
+        offset: int = 10,
+        sort: str = "asc",
+    ) -> List[Optional[Dict]]:
+        """
+        Fetch several pages of normal transactions concurrently.
+
+        Args:
+            address: Ethereum address to get transactions for
+            total_pages: Number of pages to fetch, starting at page 1
+            startblock: Starting block number
+            endblock: Ending block number
+            offset: Number of transactions per page
+            sort: Sort order ('asc' or 'desc')
+
+        Returns:
+            List of page responses (or None for failed pages), in page order
+        """
+        return await self.get_many(
+            [
+                (
+                    "",
+                    self._account_params(
+                        "txlist",
+                        address=address,
+                        startblock=startblock,
+                        endblock=endblock,
+                        page=page,
+                        offset=offset,
+                        sort=sort,
+                    ),
+                )
+                for page in range(1, total_pages + 1)
+            ]
+        )
+
+    async def iter_all_normal_transactions(
+        self, address: str, page_size: int = 10000, max_concurrency: int = 5
+    ) -> AsyncIterator[Dict]:
+        """
+        Stream every normal transaction of an address, fetching pages in windows.
+
+        Etherscan only serves the first MAX_RESULT_WINDOW rows of a query
+        (page * offset), so the history is read in block ranges: once a range
+        is exhausted the next one starts at the last block seen, skipping the
+        rows of that block already yielded. Within a range, pages are requested
+        max_concurrency at a time and windows are spaced to stay within
+        RATE_LIMIT requests per second. Iteration stops at the first page
+        holding fewer than page_size transactions.
+
+        Args:
+            address: Ethereum address to get transactions for
+            page_size: Number of transactions per page (at most MAX_RESULT_WINDOW)
+            max_concurrency: Number of pages requested per window
+
+        Yields:
+            Transaction dictionaries in ascending order
+
+        Raises:
+            ValueError: if page_size is outside 1..MAX_RESULT_WINDOW
+            RuntimeError: if a page cannot be fetched, rather than ending the
+                history early
+        """
+        if not 0 < page_size <= self.MAX_RESULT_WINDOW:
+            raise ValueError(
+                f"page_size must be between 1 and {self.MAX_RESULT_WINDOW}"
+            )
+
+        pages_per_range = self.MAX_RESULT_WINDOW // page_size
+        window_interval = max_concurrency / self.RATE_LIMIT
+        startblock = 0
+
+        # Block of the last yielded transaction and the hashes yielded from it
+        last_block = None
+        last_block_hashes = set()
+
+        while True:
+            base_params = self._account_params(
+                "txlist",
+                address=address,
+                startblock=startblock,
+                endblock=99999999,
+                offset=page_size,
+                sort="asc",
+            )
+            yielded = False
+            next_page = 1
+
+            while next_page <= pages_per_range:
+                window_start = time.monotonic()
+                pages = range(
+                    next_page, min(next_page + max_concurrency, pages_per_range + 1)
+                )
+                responses = await self.get_many(
+                    [("", {**base_params, "page": page}) for page in pages]
+                )
+                next_page = pages.stop
+
+                for page, response in zip(pages, responses):
+                    result = response.get("result") if response else None
+                    if not isinstance(result, list):
+                        raise RuntimeError(
+                            f"Could not fetch transactions of {address} "
+                            f"(startblock {startblock}, page {page}): {result!r}"
+                        )
+                    for tx in result:
+                        block = tx.get("blockNumber")
+                        if block != last_block:
+                            last_block = block
+                            last_block_hashes = set()
+                        elif tx.get("hash") in last_block_hashes:
+                            continue
+                        last_block_hashes.add(tx.get("hash"))
+                        yielded = True
+                        yield tx
+                    if len(result) < page_size:
+                        return
+
+                elapsed = time.monotonic() - window_start
+                if elapsed < window_interval:
+                    await asyncio.sleep(window_interval - elapsed)
+
+            # Every row of the range was already yielded: one block holds more
+            # transactions than a single query can return
+            if not yielded:
+                raise RuntimeError(
+                    f"Block {last_block} has more than {self.MAX_RESULT_WINDOW} "
+                    f"transactions of {address}; history cannot be paged further"
+                )
+            startblock = int(last_block)
+
+    async def get_internal_transactions(
         self,
         address: str,
         startblock: int = 0,
@@ -193,9 +636,8 @@ class EtherscanAdapter(BaseAdapter):
         Returns:
             Internal transaction list or None if failed
         """
-        params = self._build_params(
-            module="account",
-            action="txlistinternal",
+        params = self._account_params(
+            "txlistinternal",
             address=address,
             startblock=startblock,
             endblock=endblock,
@@ -203,9 +645,11 @@ class EtherscanAdapter(BaseAdapter):
             offset=offset,
             sort=sort,
         )
-        return self.get("", params=params)
+        return await self.get("", params=params)
 
-    def get_internal_transactions_by_hash(self, txhash: str) -> Optional[Dict]:
+    async def get_internal_transactions_by_hash(
+        self, txhash: str
+    ) -> Optional[Dict]:
         """
         Get internal transactions by transaction hash.
 
@@ -215,12 +659,10 @@ class EtherscanAdapter(BaseAdapter):
         Returns:
             Internal transaction data or None if failed
         """
-        params = self._build_params(
-            module="account", action="txlistinternal", txhash=txhash
-        )
-        return self.get("", params=params)
+        params = self._account_params("txlistinternal", txhash=txhash)
+        return await self.get("", params=params)
 
-    def get_internal_transactions_by_block_range(
+    async def get_internal_transactions_by_block_range(
         self,
         startblock: int,
         endblock: int,
@@ -241,20 +683,19 @@ class EtherscanAdapter(BaseAdapter):
         Returns:
             Internal transaction list or None if failed
         """
-        params = self._build_params(
-            module="account",
-            action="txlistinternal",
+        params = self._account_params(
+            "txlistinternal",
             startblock=startblock,
             endblock=endblock,
             page=page,
             offset=offset,
             sort=sort,
         )
-        return self.get("", params=params)
+        return await self.get("", params=params)
 
     # === Token Transfer Endpoints ===
 
-    def get_erc20_token_transfers(
+    async def get_erc20_token_transfers(
         self,
         address: str,
         contractaddress: str = None,
@@ -279,9 +720,8 @@ class EtherscanAdapter(BaseAdapter):
         Returns:
             ERC20 token transfer list or None if failed
         """
-        params = self._build_params(
-            module="account",
-            action="tokentx",
+        params = self._account_params(
+            "tokentx",
             address=address,
             startblock=startblock,
             endblock=endblock,
@@ -293,9 +733,50 @@ class EtherscanAdapter(BaseAdapter):
         if contractaddress:
             params["contractaddress"] = contractaddress
 
-        return self.get("", params=params)
+        return await self.get("", params=params)
 
-    def get_erc721_token_transfers(
+    async def iter_erc20_token_transfers(
+        self,
+        address: str,
+        contractaddress: str = None,
+        startblock: int = 0,
+        endblock: int = 99999999,
+        page: int = 1,
+        offset: int = 100,
+        sort: str = "asc",
+    ) -> AsyncIterator[Dict]:
+        """
+        Stream ERC20 token transfer events by address, one transfer at a time.
+
+        Args:
+            address: Ethereum address to get token transfers for
+            contractaddress: Token contract address (optional, for specific token)
+            startblock: Starting block number
+            endblock: Ending block number
+            page: Page number for pagination
+            offset: Number of transfers per page
+            sort: Sort order ('asc' or 'desc')
+
+        Yields:
+            Transfer dictionaries as they are parsed from the response
+        """
+        params = self._account_params(
+            "tokentx",
+            address=address,
+            startblock=startblock,
+            endblock=endblock,
+            page=page,
+            offset=offset,
+            sort=sort,
+        )
+
+        if contractaddress:
+            params["contractaddress"] = contractaddress
+
+        async for transfer in self.iter_result("", params=params):
+            yield transfer
+
+    async def get_erc721_token_transfers(
         self,
         address: str,
         contractaddress: str = None,
@@ -320,9 +801,8 @@ class EtherscanAdapter(BaseAdapter):
         Returns:
             ERC721 token transfer list or None if failed
         """
-        params = self._build_params(
-            module="account",
-            action="tokennfttx",
+        params = self._account_params(
+            "tokennfttx",
             address=address,
             startblock=startblock,
             endblock=endblock,
@@ -334,9 +814,9 @@ class EtherscanAdapter(BaseAdapter):
         if contractaddress:
             params["contractaddress"] = contractaddress
 
-        return self.get("", params=params)
+        return await self.get("", params=params)
 
-    def get_erc1155_token_transfers(
+    async def get_erc1155_token_transfers(
         self,
         address: str,
         contractaddress: str = None,
@@ -361,9 +841,8 @@ class EtherscanAdapter(BaseAdapter):
         Returns:
             ERC1155 token transfer list or None if failed
         """
-        params = self._build_params(
-            module="account",
-            action="token1155tx",
+        params = self._account_params(
+            "token1155tx",
             address=address,
             startblock=startblock,
             endblock=endblock,
@@ -375,11 +854,11 @@ class EtherscanAdapter(BaseAdapter):
         if contractaddress:
             params["contractaddress"] = contractaddress
 
-        return self.get("", params=params)
+        return await self.get("", params=params)
 
     # === Other Account Endpoints ===
 
-    def get_address_funded_by(self, address: str) -> Optional[Dict]:
+    async def get_address_funded_by(self, address: str) -> Optional[Dict]:
         """
         Get the address that funded an address and its relative age.
 
@@ -389,13 +868,11 @@ class EtherscanAdapter(BaseAdapter):
         Returns:
             Funding information or None if failed
         """
-        params = self._build_params(
-            module="account", action="fundedby", address=address
-        )
-        return self.get("", params=params)
+        params = self._account_params("fundedby", address=address)
+        return await self.get("", params=params)
 
 
-def example_usage():
+async def example_usage():
     """Example usage of the Etherscan adapter."""
 
     # Initialize adapter (API key should be in environment or passed directly)
@@ -406,8 +883,14 @@ def example_usage():
         print("Please set ETHERSCAN_API_KEY environment variable")
         return
 
+    async with adapter:
+        await _run_examples(adapter)
+
+
+async def _run_examples(adapter: "EtherscanAdapter"):
+    """Run the example queries against an open adapter."""
     # Test authentication
-    if not adapter.authenticate():
+    if not await adapter.authenticate():
         print("❌ Authentication failed. Please check your API key.")
         return
 
@@ -420,32 +903,31 @@ def example_usage():
 
     # Get Ether balance
     print("\n💰 Fetching Ether balance...")
-    balance = adapter.get_ether_balance(example_address)
+    balance = await adapter.get_ether_balance(example_address)
     if balance and adapter.validate_response(balance):
         balance_wei = balance.get("result", "0")
-        balance_eth = int(balance_wei) / 10**18 if balance_wei.isdigit() else 0
+        balance_eth = safe_wei_to_eth(balance_wei)
         print(f"Balance: {balance_eth:.4f} ETH ({balance_wei} wei)")
     else:
         print("Failed to fetch balance")
 
     # Get recent transactions
     print("\n📝 Fetching recent transactions...")
-    transactions = adapter.get_normal_transactions(
+    # Collect display columns once (SoA) and convert values in one batch
+    hashes, values = [], []
+    tx_count = 0
+    async for tx in adapter.iter_normal_transactions(
         example_address, startblock=0, endblock=99999999, page=1, offset=5, sort="desc"
-    )
-
-    if transactions and adapter.validate_response(transactions):
-        tx_list = transactions.get("result", [])
-        print(f"Found {len(tx_list)} recent transactions:")
-        for i, tx in enumerate(tx_list[:3]):  # Show first 3
-            value_eth = (
-                int(tx.get("value", "0")) / 10**18
-                if tx.get("value", "0").isdigit()
-                else 0
-            )
-            print(
-                f"  {i+1}. Hash: {tx.get('hash', 'N/A')[:20]}... Value: {value_eth:.4f} ETH"
-            )
+    ):
+        tx_count += 1
+        if tx_count <= 3:  # Show first 3
+            hashes.append(tx.get("hash", "N/A"))
+            values.append(tx.get("value", "0"))
+
+    if tx_count:
+        print(f"Found {tx_count} recent transactions:")
+        for i, (tx_hash, value_eth) in enumerate(zip(hashes, wei_to_eth(values))):
+            print(f"  {i+1}. Hash: {tx_hash[:20]}... Value: {value_eth:.4f} ETH")
     else:
         print("Failed to fetch transactions")
 
@@ -456,17 +938,18 @@ def example_usage():
         "0x0000000000000000000000000000000000000000",  # Zero address
     ]
 
-    multi_balance = adapter.get_ether_balance_multi(test_addresses)
+    multi_balance = await adapter.get_ether_balance_multi(test_addresses)
     if multi_balance and adapter.validate_response(multi_balance):
         balances = multi_balance.get("result", [])
-        for balance_info in balances:
-            addr = balance_info.get("account", "Unknown")
-            balance_wei = balance_info.get("balance", "0")
-            balance_eth = int(balance_wei) / 10**18 if balance_wei.isdigit() else 0
+        accounts = [info.get("account", "Unknown") for info in balances]
+        balances_eth = wei_to_eth([info.get("balance", "0") for info in balances])
+        for addr, balance_eth in zip(accounts, balances_eth):
             print(f"  {addr[:10]}... : {balance_eth:.4f} ETH")
     else:
         print("Failed to fetch multiple balances")
 
 
 if __name__ == "__main__":
-    example_usage()
+    from utils.runtime import run
+
+    run(example_usage())
@@ -6,15 +6,52 @@ Documentation: https://developers.zerion.io/reference/listwalletpositions
 """
 
 import os
+import asyncio
 import base64
+from functools import lru_cache
 from typing import Dict, Optional, Any, List
 
-from .base import BaseAdapter
+from .async_base import AsyncBaseAdapter
 
 
-class ZerionAdapter(BaseAdapter):
+# Query parameters accepted by the wallet positions endpoint
+_POSITION_PARAMS = frozenset(
+    (
+        "currency",
+        "sort",
+        "page[size]",
+        "page[before]",
+        "page[after]",
+        "filter[positions]",
+        "filter[trash]",
+        "filter[dust]",
+        "filter[chain_ids]",
+    )
+)
+
+
+@lru_cache(maxsize=8)
+def _zerion_basic_auth(raw_key: str) -> str:
+    """Build the Basic-Auth header value for a Zerion API key."""
+    return (b"Basic " + base64.b64encode(raw_key.encode() + b":")).decode()
+
+
+# Header for the environment-configured key, computed once at import
+_ENV_API_KEY = os.getenv("ZERION_API_KEY")
+_ENV_AUTH_HEADER = _zerion_basic_auth(_ENV_API_KEY) if _ENV_API_KEY else None
+
+
+class ZerionAdapter(AsyncBaseAdapter):
     """Adapter for Zerion API to fetch wallet positions and blockchain data."""
 
+    __slots__ = ("api_key", "use_testnet", "_auth_header")
+
+    # Maximum outstanding requests for multi-wallet queries (Zerion rate-limits)
+    MULTI_CONCURRENCY = 16
+
+    # Testnet and mainnet responses are cached separately
+    CACHE_KEY_HEADERS = ("X-Env",)
+
     def __init__(self, api_key: str = None, use_testnet: bool = False):
         """
         Initialize Zerion adapter.
@@ -24,15 +61,21 @@ class ZerionAdapter(BaseAdapter):
             use_testnet: Whether to use testnet data (sets X-Env header)
         """
 
-        raw_api_key = api_key or os.getenv("ZERION_API_KEY")
-        encoded_bytes = base64.b64encode(f"{raw_api_key}:".encode("utf-8"))
-        self.api_key = encoded_bytes.decode("utf-8")
+        self.api_key = api_key or os.getenv("ZERION_API_KEY")
         self.use_testnet = use_testnet
 
+        if not self.api_key:
+            raise ValueError(
+                "Zerion API key is required. Set ZERION_API_KEY env var or pass api_key parameter."
+            )
+
         # Set up headers for Zerion API
-        headers = {}
-        if self.api_key:
-            headers["Authorization"] = f"Basic {self.api_key}"
+        self._auth_header = (
+            _ENV_AUTH_HEADER
+            if self.api_key == _ENV_API_KEY
+            else _zerion_basic_auth(self.api_key)
+        )
+        headers = {"Authorization": self._auth_header}
 
         if self.use_testnet:
             headers["X-Env"] = "testnet"
@@ -44,7 +87,7 @@ class ZerionAdapter(BaseAdapter):
             timeout=120,  # Zerion recommends 2 minutes timeout
         )
 
-    def authenticate(self) -> bool:
+    async def authenticate(self) -> bool:
         """
         Authenticate with Zerion API by testing a simple endpoint.
 
@@ -57,7 +100,7 @@ class ZerionAdapter(BaseAdapter):
 
         try:
             # Test authentication with chains endpoint
-            response = self.get_chains()
+            response = await self.get_chains()
             return response is not None and self.validate_response(response)
         except Exception as e:
             self._handle_error(f"Authentication failed: {e}")
@@ -81,7 +124,15 @@ class ZerionAdapter(BaseAdapter):
         # Most Zerion responses have 'data' field
         return "data" in response or "links" in response or "meta" in response
 
-    def get_wallet_positions(self, wallet_address: str, **kwargs) -> Optional[Dict]:
+    def _expiry_for(self, endpoint: str, params: Dict[str, Any]) -> Optional[float]:
+        """Cache reference data (chains, fungible assets) for a day."""
+        if endpoint.startswith(("chains", "fungibles/")):
+            return 24 * 60 * 60
+        return self.DEFAULT_CACHE_EXPIRY
+
+    async def get_wallet_positions(
+        self, wallet_address: str, **kwargs
+    ) -> Optional[Dict]:
         """
         Get list of wallet's fungible positions.
 
@@ -94,29 +145,14 @@ class ZerionAdapter(BaseAdapter):
         """
         endpoint = f"wallets/{wallet_address}/positions"
 
-        # Build query parameters
-        params = {}
-
-        # Common parameters from Zerion API docs
-        supported_params = [
-            "currency",
-            "sort",
-            "page[size]",
-            "page[before]",
-            "page[after]",
-            "filter[positions]",
-            "filter[trash]",
-            "filter[dust]",
-            "filter[chain_ids]",
-        ]
+        # Keep only the query parameters supported by the Zerion API
+        params = {key: kwargs[key] for key in _POSITION_PARAMS.intersection(kwargs)}
 
-        for param in supported_params:
-            if param in kwargs:
-                params[param] = kwargs[param]
+        return await self.get(endpoint, params=params)
 
-        return self.get(endpoint, params=params)
-
-    def get_wallet_portfolio(self, wallet_address: str, **kwargs) -> Optional[Dict]:
+    async def get_wallet_portfolio(
+        self, wallet_address: str, **kwargs
+    ) -> Optional[Dict]:
         """
         Get wallet's portfolio overview.
 
@@ -128,9 +164,11 @@ class ZerionAdapter(BaseAdapter):
             Portfolio data or None if failed
         """
         endpoint = f"wallets/{wallet_address}/portfolio"
-        return self.get(endpoint, params=kwargs)
+        return await self.get(endpoint, params=kwargs)
 
-    def get_wallet_transactions(self, wallet_address: str, **kwargs) -> Optional[Dict]:
+    async def get_wallet_transactions(
+        self, wallet_address: str, **kwargs
+    ) -> Optional[Dict]:
         """
         Get list of wallet's transactions.
 
@@ -142,9 +180,9 @@ class ZerionAdapter(BaseAdapter):
             Transactions data or None if failed
         """
         endpoint = f"wallets/{wallet_address}/transactions"
-        return self.get(endpoint, params=kwargs)
+        return await self.get(endpoint, params=kwargs)
 
-    def get_wallet_nft_collections(
+    async def get_wallet_nft_collections(
         self, wallet_address: str, **kwargs
     ) -> Optional[Dict]:
         """
@@ -158,9 +196,85 @@ class ZerionAdapter(BaseAdapter):
             NFT collections data or None if failed
         """
         endpoint = f"wallets/{wallet_address}/nft-collections"
-        return self.get(endpoint, params=kwargs)
+        return await self.get(endpoint, params=kwargs)
+
+    async def fetch_wallet_bundle(
+        self, wallet_address: str, **kwargs
+    ) -> Dict[str, Optional[Dict]]:
+        """
+        Fetch positions, portfolio, transactions and NFT collections concurrently.
+
+        Args:
+            wallet_address: Wallet address to fetch data for
+            **kwargs: Query parameters forwarded to every request
+
+        Returns:
+            Dictionary keyed by data type, each value the response or None if failed
+        """
+        positions, portfolio, transactions, nft_collections = await asyncio.gather(
+            self.get_wallet_positions(wallet_address, **kwargs),
+            self.get_wallet_portfolio(wallet_address, **kwargs),
+            self.get_wallet_transactions(wallet_address, **kwargs),
+            self.get_wallet_nft_collections(wallet_address, **kwargs),
+        )
+        return {
+            "positions": positions,
+            "portfolio": portfolio,
+            "transactions": transactions,
+            "nft_collections": nft_collections,
+        }
+
+    async def get_positions_multi(
+        self, addresses: List[str], concurrency: int = None, **kwargs
+    ) -> Dict[str, Optional[Dict]]:
+        """
+        Get fungible positions for several wallets concurrently.
+
+        Args:
+            addresses: Wallet addresses to fetch positions for
+            concurrency: Maximum outstanding requests (default: MULTI_CONCURRENCY)
+            **kwargs: Query parameters forwarded to every request
+
+        Returns:
+            Dictionary mapping each address to its positions data (None if failed)
+        """
+        semaphore = asyncio.Semaphore(concurrency or self.MULTI_CONCURRENCY)
+
+        async def fetch(address: str):
+            async with semaphore:
+                return address, await self.get_wallet_positions(address, **kwargs)
+
+        return dict(await asyncio.gather(*(fetch(a) for a in addresses)))
+
+    async def get_wallet_bundle_multi(
+        self, addresses: List[str], concurrency: int = None, **kwargs
+    ) -> Dict[str, Dict[str, Optional[Dict]]]:
+        """
+        Fetch the wallet bundle (see fetch_wallet_bundle) for several wallets.
+
+        Each wallet issues four requests, so at most concurrency wallets are
+        fetched at once to keep outstanding requests bounded.
+
+        Args:
+            addresses: Wallet addresses to fetch data for
+            concurrency: Maximum wallets fetched at once
+                (default: MULTI_CONCURRENCY // 4)
+            **kwargs: Query parameters forwarded to every request
+
+        Returns:
+            Dictionary mapping each address to its bundle
+        """
+        semaphore = asyncio.Semaphore(
+            concurrency or max(1, self.MULTI_CONCURRENCY // 4)
+        )
+
+        async def fetch(address: str):
+            async with semaphore:
+                return address, await self.fetch_wallet_bundle(address, **kwargs)
+
+        return dict(await asyncio.gather(*(fetch(a) for a in addresses)))
 
-    def get_fungible_assets(self, **kwargs) -> Optional[Dict]:
+    async def get_fungible_assets(self, **kwargs) -> Optional[Dict]:
         """
         Get list of fungible assets.
 
@@ -170,9 +284,9 @@ class ZerionAdapter(BaseAdapter):
         Returns:
             Fungible assets data or None if failed
         """
-        return self.get("fungibles", params=kwargs)
+        return await self.get("fungibles", params=kwargs)
 
-    def get_fungible_asset_by_id(self, asset_id: str) -> Optional[Dict]:
+    async def get_fungible_asset_by_id(self, asset_id: str) -> Optional[Dict]:
         """
         Get specific fungible asset by ID.
 
@@ -182,18 +296,18 @@ class ZerionAdapter(BaseAdapter):
         Returns:
             Asset data or None if failed
         """
-        return self.get(f"fungibles/{asset_id}")
+        return await self.get(f"fungibles/{asset_id}")
 
-    def get_chains(self) -> Optional[Dict]:
+    async def get_chains(self) -> Optional[Dict]:
         """
         Get list of all supported chains.
 
         Returns:
             Chains data or None if failed
         """
-        return self.get("chains")
+        return await self.get("chains")
 
-    def get_chain_by_id(self, chain_id: str) -> Optional[Dict]:
+    async def get_chain_by_id(self, chain_id: str) -> Optional[Dict]:
         """
         Get specific chain by ID.
 
@@ -203,4 +317,4 @@ class ZerionAdapter(BaseAdapter):
         Returns:
             Chain data or None if failed
         """
-        return self.get(f"chains/{chain_id}")
+        return await self.get(f"chains/{chain_id}")
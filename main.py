@@ -7,18 +7,24 @@ shows detailed calculations for each trait and metric.
 """
 
 import os
+import sys
 import asyncio
-from dotenv import load_dotenv
-from adapters.etherscan import EtherscanAdapter
-from adapters.zerion import ZerionAdapter
-from portfolio_analyzer import PortfolioAnalyzer
+from typing import List
 
-# Load environment variables
-load_dotenv()
+# Maximum wallets analyzed at once (bounds simultaneous explorer API calls)
+MAX_CONCURRENT_ANALYSES = 10
 
 
 async def test_detailed_metrics():
     """Test the detailed metrics functionality."""
+    # Imported here so importing this module stays cheap
+    from dotenv import load_dotenv
+    from adapters.etherscan import EtherscanAdapter
+    from adapters.zerion import ZerionAdapter
+    from portfolio_analyzer import PortfolioAnalyzer
+
+    # Load environment variables
+    load_dotenv()
 
     # Get API keys
     etherscan_api_key = os.getenv("ETHERSCAN_API_KEY")
@@ -43,99 +49,94 @@ async def test_detailed_metrics():
     ]
 
     async with PortfolioAnalyzer(base_adapter, zerion_adapter) as analyzer:
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_ANALYSES)
 
-        for address in test_addresses:
-            print(f"\n🎯 Testing wallet: {address}")
-            print("=" * 60)
-
-            try:
-                # Analyze with detailed metrics
-                result = await analyzer.analyze_wallet(
+        async def analyze(address: str) -> dict:
+            async with semaphore:
+                return await analyzer.analyze_wallet(
                     address, show_detailed_metrics=True
                 )
 
-                if result.get("error"):
-                    print(f"❌ Error: {result['error']}")
-                    continue
-
-                # Additional detailed breakdown
-                persona_data = result.get("persona", {})
-                detailed_metrics = persona_data.get("detailed_metrics", [])
-
-                if detailed_metrics:
-                    print(f"\n🔬 METRIC BREAKDOWN SUMMARY")
-                    print("-" * 40)
-
-                    # Group by persona type and show pass/fail counts
-                    persona_scores = {}
-                    for metric in detailed_metrics:
-                        persona_type = metric["persona_type"]
-                        if persona_type not in persona_scores:
-                            persona_scores[persona_type] = {"passed": 0, "total": 0}
-
-                        persona_scores[persona_type]["total"] += 1
-                        if metric["passes"]:
-                            persona_scores[persona_type]["passed"] += 1
-
-                    for persona_type, scores in persona_scores.items():
-                        percentage = (scores["passed"] / scores["total"]) * 100
-                        status = (
-                            "🟢"
-                            if percentage >= 80
-                            else "🟡" if percentage >= 50 else "🔴"
-                        )
-                        print(
-                            f"{status} {persona_type}: {scores['passed']}/{scores['total']} ({percentage:.1f}%)"
-                        )
-
-                    persona = result["persona"]["classification"]
-                    print(f"\n🎯 Result: Classified as '{persona}'")
-
-                    # Show scoring details if available
-                    if hasattr(analyzer.persona_classifier, "_last_persona_scores"):
-                        scores = analyzer.persona_classifier._last_persona_scores
-                        best_score = analyzer.persona_classifier._last_best_score
-
-                        print(f"\n📊 Detailed Scoring Breakdown:")
-                        print("-" * 40)
-
-                        # Sort personas by score
-                        sorted_personas = sorted(
-                            scores.items(),
-                            key=lambda x: (
-                                x[1]["total_score"] / x[1]["max_possible"]
-                                if x[1]["max_possible"] > 0
-                                else 0
-                            ),
-                            reverse=True,
-                        )
-
-                        for rank, (persona_type, score_data) in enumerate(
-                            sorted_personas, 1
-                        ):
-                            if score_data["max_possible"] > 0:
-                                percentage = (
-                                    score_data["total_score"]
-                                    / score_data["max_possible"]
-                                ) * 100
-                                status = "👑 WINNER" if rank == 1 else f"#{rank}"
-                                print(
-                                    f"{status} {persona_type}: "
-                                    f"{score_data['total_score']}/{score_data['max_possible']} points "
-                                    f"({score_data['passed_metrics']}/{score_data['total_metrics']} criteria) "
-                                    f"= {percentage:.1f}%"
-                                )
-
-                        print(f"\n✨ Overall confidence: {best_score * 100:.1f}%")
-
-                print(f"\n✅ Analysis complete for {address}")
-
-            except Exception as e:
-                print(f"❌ Error analyzing {address}: {e}")
-                continue
+        # Analyze all wallets concurrently, then report them in order
+        outcomes = await asyncio.gather(
+            *(analyze(address) for address in test_addresses), return_exceptions=True
+        )
+
+        for address, outcome in zip(test_addresses, outcomes):
+            # Buffer each wallet's report and write it in one call
+            lines = [f"\n🎯 Testing wallet: {address}", "=" * 60]
+
+            if isinstance(outcome, Exception):
+                lines.append(f"❌ Error analyzing {address}: {outcome}")
+            elif outcome.get("error"):
+                lines.append(f"❌ Error: {outcome['error']}")
+            else:
+                lines.extend(_format_metric_summary(outcome))
+                lines.append(f"\n✅ Analysis complete for {address}")
+
+            sys.stdout.write("\n".join(lines) + "\n")
 
         print(f"\n🎉 Testing complete!")
 
 
+def _format_metric_summary(result: dict) -> List[str]:
+    """Format the per-persona pass counts and scoring breakdown for one wallet."""
+    lines = []
+    persona_data = result.get("persona", {})
+    detailed_metrics = persona_data.get("detailed_metrics", [])
+    scores = persona_data.get("persona_scores")
+    best_score = persona_data.get("best_score")
+
+    if not detailed_metrics:
+        return lines
+
+    lines.append(f"\n🔬 METRIC BREAKDOWN SUMMARY")
+    lines.append("-" * 40)
+
+    # Group by persona type and show pass/fail counts
+    persona_scores = {}
+    for metric in detailed_metrics:
+        persona_type = metric.persona_type
+        if persona_type not in persona_scores:
+            persona_scores[persona_type] = {"passed": 0, "total": 0}
+
+        persona_scores[persona_type]["total"] += 1
+        if metric.passes:
+            persona_scores[persona_type]["passed"] += 1
+
+    for persona_type, counts in persona_scores.items():
+        percentage = (counts["passed"] / counts["total"]) * 100
+        status = "🟢" if percentage >= 80 else "🟡" if percentage >= 50 else "🔴"
+        lines.append(
+            f"{status} {persona_type}: {counts['passed']}/{counts['total']} ({percentage:.1f}%)"
+        )
+
+    persona = persona_data["classification"]
+    lines.append(f"\n🎯 Result: Classified as '{persona}'")
+
+    # Show scoring details if available
+    if scores is not None:
+        lines.append(f"\n📊 Detailed Scoring Breakdown:")
+        lines.append("-" * 40)
+
+        # Scores arrive ranked best first, with each ratio already computed
+        for rank, (persona_type, score_data) in enumerate(scores.items(), 1):
+            if score_data["max_possible"] > 0:
+                percentage = score_data["score_ratio"] * 100
+                status = "👑 WINNER" if rank == 1 else f"#{rank}"
+                lines.append(
+                    f"{status} {persona_type}: "
+                    f"{score_data['total_score']}/{score_data['max_possible']} points "
+                    f"({score_data['passed_metrics']}/{score_data['total_metrics']} criteria) "
+                    f"= {percentage:.1f}%"
+                )
+
+        lines.append(f"\n✨ Overall confidence: {best_score * 100:.1f}%")
+
+    return lines
+
+
 if __name__ == "__main__":
-    asyncio.run(test_detailed_metrics())
+    from utils.runtime import run
+
+    run(test_detailed_metrics())
@@ -2,6 +2,11 @@
 Data models for portfolio analysis.
 """
 
-from .portfolio_models import TokenHolding, NFTHolding, PortfolioSnapshot
+from .portfolio_models import (
+    TokenHolding,
+    NFTHolding,
+    PortfolioSnapshot,
+    PortfolioAggregates,
+)
 
-__all__ = ["TokenHolding", "NFTHolding", "PortfolioSnapshot"]
+__all__ = ["TokenHolding", "NFTHolding", "PortfolioSnapshot", "PortfolioAggregates"]
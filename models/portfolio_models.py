@@ -5,15 +5,17 @@ This module contains the core data structures used throughout the portfolio anal
 """
 
 from datetime import datetime
-from typing import List, Tuple, Optional
-from dataclasses import dataclass
+from typing import List, NamedTuple, Tuple, Optional
+from dataclasses import dataclass, field, InitVar
 
+import numpy as np
 
-@dataclass
+
+@dataclass(slots=True)
 class TokenHolding:
     """Represents a token holding with valuation data and detailed transaction history."""
 
-    contract_address: str
+    contract_address: str  # Always stored lowercased
     symbol: str
     balance: float
     decimals: int
@@ -32,20 +34,25 @@ class TokenHolding:
     sale_transactions: int = 0  # Number of sell transactions
 
     # Legacy fields for backward compatibility
-    first_acquired: Optional[datetime] = None
-    last_acquired: Optional[datetime] = None
+    first_acquired: Optional[datetime] = field(default=None, repr=False)
+    last_acquired: Optional[datetime] = field(default=None, repr=False)
+
+    # Reference time for the holding period (shared across a snapshot's holdings)
+    now: InitVar[Optional[datetime]] = None
 
-    def __post_init__(self):
+    def __post_init__(self, now: Optional[datetime]):
         """Post-initialization to handle legacy field mapping."""
+        # Lowercase once so lookups keyed by contract can use it directly
+        self.contract_address = self.contract_address.lower()
+
         # Map legacy fields to new fields for backward compatibility
-        if self.first_acquired and not self.acquisition_date:
-            self.acquisition_date = self.first_acquired
-        if self.last_acquired and not self.last_activity_date:
-            self.last_activity_date = self.last_acquired
+        self.acquisition_date = self.acquisition_date or self.first_acquired
+        self.last_activity_date = self.last_activity_date or self.last_acquired
 
         # Calculate holding period if not set
-        if self.holding_period_days == 0 and self.acquisition_date:
-            self.holding_period_days = (datetime.now() - self.acquisition_date).days
+        if not self.holding_period_days and self.acquisition_date:
+            now = now or datetime.now()
+            self.holding_period_days = (now - self.acquisition_date).days
 
     @property
     def net_position(self) -> float:
@@ -65,11 +72,11 @@ class TokenHolding:
         return self.sale_transactions > 0 and self.trading_activity_ratio > 0.1
 
 
-@dataclass
+@dataclass(slots=True)
 class NFTHolding:
     """Represents an NFT holding with enhanced tracking."""
 
-    contract_address: str
+    contract_address: str  # Always stored lowercased
     token_id: str
     collection_name: str
     estimated_value_usd: float = 0.0
@@ -84,17 +91,23 @@ class NFTHolding:
     token_ids: Optional[List[str]] = None  # List of token IDs in collection
 
     # Legacy field for backward compatibility
-    acquired_date: Optional[datetime] = None
+    acquired_date: Optional[datetime] = field(default=None, repr=False)
+
+    # Reference time for the holding period (shared across a snapshot's holdings)
+    now: InitVar[Optional[datetime]] = None
 
-    def __post_init__(self):
+    def __post_init__(self, now: Optional[datetime]):
         """Post-initialization to handle legacy field mapping."""
+        # Lowercase once so lookups keyed by contract can use it directly
+        self.contract_address = self.contract_address.lower()
+
         # Map legacy fields to new fields for backward compatibility
-        if self.acquired_date and not self.acquisition_date:
-            self.acquisition_date = self.acquired_date
+        self.acquisition_date = self.acquisition_date or self.acquired_date
 
         # Calculate holding period if not set
-        if self.holding_period_days == 0 and self.acquisition_date:
-            self.holding_period_days = (datetime.now() - self.acquisition_date).days
+        if not self.holding_period_days and self.acquisition_date:
+            now = now or datetime.now()
+            self.holding_period_days = (now - self.acquisition_date).days
 
     @property
     def average_value_per_nft(self) -> float:
@@ -104,7 +117,26 @@ class NFTHolding:
         return 0.0
 
 
-@dataclass
+# Positions worth more than $0 but less than this are counted as dust
+DUST_THRESHOLD_USD = 5.0
+
+# Holding count above which aggregates are computed with NumPy reductions
+VECTORIZE_MIN_HOLDINGS = 50
+
+
+class PortfolioAggregates(NamedTuple):
+    """Aggregates over a snapshot's holdings, computed in a single pass."""
+
+    top_asset: str
+    top_asset_value: float
+    total_token_value: float
+    total_nft_value: float
+    longest_holding_period: int
+    dust_positions_count: int
+    dust_value_usd: float
+
+
+@dataclass(slots=True)
 class PortfolioSnapshot:
     """Represents a complete portfolio snapshot with enhanced analytics."""
 
@@ -116,23 +148,22 @@ class PortfolioSnapshot:
     total_value_usd: float
     analysis_timestamp: datetime
 
+    # Derived data, computed on first use and kept for the snapshot's lifetime
+    _aggregates_cache: Optional[PortfolioAggregates] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _token_values_cache: Optional[np.ndarray] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _nft_values_cache: Optional[np.ndarray] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
     @property
     def top_asset_by_value(self) -> Tuple[str, float]:
         """Get the top asset by USD value."""
-        assets = [("ETH", self.eth_value_usd)]
-        assets.extend(
-            [(holding.symbol, holding.value_usd) for holding in self.token_holdings]
-        )
-        assets.extend(
-            [
-                (f"NFT-{holding.collection_name}", holding.estimated_value_usd)
-                for holding in self.nft_holdings
-            ]
-        )
-
-        if assets:
-            return max(assets, key=lambda x: x[1])
-        return ("None", 0.0)
+        aggregates = self._aggregates
+        return aggregates.top_asset, aggregates.top_asset_value
 
     @property
     def token_concentration_ratio(self) -> float:
@@ -155,22 +186,162 @@ class PortfolioSnapshot:
         top_asset, _ = self.top_asset_by_value
         return top_asset != "ETH" and not top_asset.startswith("NFT-")
 
+    def compute_aggregates(self) -> PortfolioAggregates:
+        """
+        Get the top asset, value totals, longest holding period and dust stats.
+
+        The holdings are walked once per snapshot; the aggregate properties
+        (top_asset_by_value, total_token_value, dust_value_usd, ...) all read
+        from the same cached result.
+
+        Returns:
+            PortfolioAggregates for this snapshot
+        """
+        return self._aggregates
+
+    @property
+    def _aggregates(self) -> PortfolioAggregates:
+        """Compute all holding aggregates once."""
+        if self._aggregates_cache is None:
+            holding_count = len(self.token_holdings) + len(self.nft_holdings)
+            if holding_count > VECTORIZE_MIN_HOLDINGS:
+                self._aggregates_cache = self._aggregate_arrays()
+            else:
+                self._aggregates_cache = self._aggregate_loop()
+        return self._aggregates_cache
+
+    @property
+    def _token_values(self) -> np.ndarray:
+        """USD values of the token holdings as a float64 column."""
+        if self._token_values_cache is None:
+            self._token_values_cache = np.fromiter(
+                (h.value_usd for h in self.token_holdings),
+                np.float64,
+                len(self.token_holdings),
+            )
+        return self._token_values_cache
+
+    @property
+    def _nft_values(self) -> np.ndarray:
+        """Estimated USD values of the NFT holdings as a float64 column."""
+        if self._nft_values_cache is None:
+            self._nft_values_cache = np.fromiter(
+                (h.estimated_value_usd for h in self.nft_holdings),
+                np.float64,
+                len(self.nft_holdings),
+            )
+        return self._nft_values_cache
+
+    def _aggregate_arrays(self) -> PortfolioAggregates:
+        """Aggregate over column arrays of the holdings (large portfolios)."""
+        token_count = len(self.token_holdings)
+        nft_count = len(self.nft_holdings)
+        token_values = self._token_values
+        nft_values = self._nft_values
+        periods = np.fromiter(
+            (
+                h.holding_period_days
+                for holdings in (self.token_holdings, self.nft_holdings)
+                for h in holdings
+            ),
+            np.int64,
+            token_count + nft_count,
+        )
+
+        values = np.concatenate((token_values, nft_values))
+        dust = values[(values > 0) & (values < DUST_THRESHOLD_USD)]
+        eth_is_dust = 0 < self.eth_value_usd < DUST_THRESHOLD_USD
+
+        # ETH wins ties, then the first holding with the highest value
+        top_asset, top_value = "ETH", self.eth_value_usd
+        top_index = int(values.argmax())
+        if values[top_index] > top_value:
+            top_value = float(values[top_index])
+            if top_index < token_count:
+                top_asset = self.token_holdings[top_index].symbol
+            else:
+                nft = self.nft_holdings[top_index - token_count]
+                top_asset = f"NFT-{nft.collection_name}"
+
+        return PortfolioAggregates(
+            top_asset,
+            top_value,
+            float(token_values.sum()),
+            float(nft_values.sum()),
+            max(int(periods.max()), 0),
+            int(dust.size) + eth_is_dust,
+            float(dust.sum()) + (self.eth_value_usd if eth_is_dust else 0.0),
+        )
+
+    def _aggregate_loop(self) -> PortfolioAggregates:
+        """Aggregate in a single Python pass (small portfolios)."""
+        # Track the top holding itself; its display name is built once at the end
+        top_token = top_nft = None
+        top_value = self.eth_value_usd
+        longest_period = 0
+        dust_count = 0
+        dust_value = 0.0
+
+        # Count ETH if it is dust
+        if 0 < self.eth_value_usd < DUST_THRESHOLD_USD:
+            dust_count += 1
+            dust_value += self.eth_value_usd
+
+        total_token_value = 0.0
+        for holding in self.token_holdings:
+            value = holding.value_usd
+            total_token_value += value
+            if value > top_value:
+                top_token, top_value = holding, value
+            if holding.holding_period_days > longest_period:
+                longest_period = holding.holding_period_days
+            if 0 < value < DUST_THRESHOLD_USD:
+                dust_count += 1
+                dust_value += value
+
+        total_nft_value = 0.0
+        for holding in self.nft_holdings:
+            value = holding.estimated_value_usd
+            total_nft_value += value
+            if value > top_value:
+                top_nft, top_value = holding, value
+            if holding.holding_period_days > longest_period:
+                longest_period = holding.holding_period_days
+            if 0 < value < DUST_THRESHOLD_USD:
+                dust_count += 1
+                dust_value += value
+
+        if top_nft is not None:
+            top_asset = f"NFT-{top_nft.collection_name}"
+        elif top_token is not None:
+            top_asset = top_token.symbol
+        else:
+            top_asset = "ETH"
+
+        return PortfolioAggregates(
+            top_asset,
+            top_value,
+            total_token_value,
+            total_nft_value,
+            longest_period,
+            dust_count,
+            dust_value,
+        )
+
     @property
     def longest_holding_period(self) -> int:
         """Get the longest holding period in days."""
-        periods = [holding.holding_period_days for holding in self.token_holdings]
-        periods.extend([holding.holding_period_days for holding in self.nft_holdings])
-        return max(periods) if periods else 0
+        return self._aggregates.longest_holding_period
 
     @property
     def total_token_value(self) -> float:
         """Get total value of token holdings."""
-        return sum(holding.value_usd for holding in self.token_holdings)
+        return self._aggregates.total_token_value
 
     @property
     def total_nft_value(self) -> float:
         """Get total value of NFT holdings."""
-        return sum(holding.estimated_value_usd for holding in self.nft_holdings)
+        return self._aggregates.total_nft_value
 
     @property
     def portfolio_composition(self) -> dict:
@@ -211,6 +382,9 @@ class PortfolioSnapshot:
         self, min_value_usd: float = 5.0
     ) -> List[TokenHolding]:
         """Get token holdings with value above the specified threshold."""
+        if len(self.token_holdings) > VECTORIZE_MIN_HOLDINGS:
+            indices = np.flatnonzero(self._token_values >= min_value_usd)
+            return [self.token_holdings[i] for i in indices]
         return [
             holding
             for holding in self.token_holdings
@@ -221,6 +395,9 @@ class PortfolioSnapshot:
         self, min_value_usd: float = 5.0
     ) -> List[NFTHolding]:
         """Get NFT holdings with value above the specified threshold."""
+        if len(self.nft_holdings) > VECTORIZE_MIN_HOLDINGS:
+            indices = np.flatnonzero(self._nft_values >= min_value_usd)
+            return [self.nft_holdings[i] for i in indices]
         return [
             holding
             for holding in self.nft_holdings
@@ -229,67 +406,33 @@ class PortfolioSnapshot:
 
     def get_all_significant_positions(self, min_value_usd: float = 5.0) -> dict:
         """Get all positions (ETH, tokens, NFTs) with value above the specified threshold."""
-        positions = {
-            "eth": self.eth_value_usd >= min_value_usd,
-            "eth_value": (
-                self.eth_value_usd if self.eth_value_usd >= min_value_usd else 0
-            ),
-            "tokens": self.get_significant_token_holdings(min_value_usd),
-            "nfts": self.get_significant_nft_holdings(min_value_usd),
-        }
+        eth_significant = self.eth_value_usd >= min_value_usd
+        eth_value = self.eth_value_usd if eth_significant else 0
+        tokens = self.get_significant_token_holdings(min_value_usd)
+        nfts = self.get_significant_nft_holdings(min_value_usd)
 
         # Calculate total significant value
-        total_significant_value = positions["eth_value"]
-        total_significant_value += sum(t.value_usd for t in positions["tokens"])
-        total_significant_value += sum(n.estimated_value_usd for n in positions["nfts"])
-
-        positions["total_significant_value"] = total_significant_value
-        positions["significant_position_count"] = (
-            (1 if positions["eth"] else 0)
-            + len(positions["tokens"])
-            + len(positions["nfts"])
-        )
+        total_significant_value = eth_value
+        total_significant_value += sum(t.value_usd for t in tokens)
+        total_significant_value += sum(n.estimated_value_usd for n in nfts)
 
-        return positions
+        return {
+            "eth": eth_significant,
+            "eth_value": eth_value,
+            "tokens": tokens,
+            "nfts": nfts,
+            "total_significant_value": total_significant_value,
+            "significant_position_count": (
+                int(eth_significant) + len(tokens) + len(nfts)
+            ),
+        }
 
     @property
     def dust_positions_count(self) -> int:
         """Count positions with value less than $5 (dust positions)."""
-        dust_count = 0
-
-        # Count ETH if less than $5
-        if 0 < self.eth_value_usd < 5.0:
-            dust_count += 1
-
-        # Count tokens less than $5
-        dust_count += len([t for t in self.token_holdings if 0 < t.value_usd < 5.0])
-
-        # Count NFTs less than $5
-        dust_count += len(
-            [n for n in self.nft_holdings if 0 < n.estimated_value_usd < 5.0]
-        )
-
-        return dust_count
+        return self._aggregates.dust_positions_count
 
     @property
     def dust_value_usd(self) -> float:
         """Total value of dust positions (less than $5)."""
-        dust_value = 0.0
-
-        # Add ETH if less than $5
-        if 0 < self.eth_value_usd < 5.0:
-            dust_value += self.eth_value_usd
-
-        # Add tokens less than $5
-        dust_value += sum(
-            t.value_usd for t in self.token_holdings if 0 < t.value_usd < 5.0
-        )
-
-        # Add NFTs less than $5
-        dust_value += sum(
-            n.estimated_value_usd
-            for n in self.nft_holdings
-            if 0 < n.estimated_value_usd < 5.0
-        )
-
-        return dust_value
+        return self._aggregates.dust_value_usd
@@ -2,6 +2,6 @@
 Persona classification and analysis.
 """
 
-from .persona_classifier import PersonaClassifier
+from .persona_classifier import MetricResult, PersonaClassifier
 
-__all__ = ["PersonaClassifier"]
+__all__ = ["MetricResult", "PersonaClassifier"]
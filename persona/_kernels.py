@@ -0,0 +1,70 @@
+"""
+Compiled kernels for persona scoring.
+
+Operate on a boolean pass/fail matrix (wallets x metrics) and the
+(metrics x personas) weight matrix built from the metric table, so the
+per-wallet scoring runs in native code rather than the interpreter.
+"""
+
+import numpy as np
+from numba import njit, prange
+
+
+@njit(cache=True)
+def score_wallet(passes, weights, max_possible):
+    """
+    Pick the best persona for one wallet.
+
+    Ties on percentage go to the higher total score, then the earlier persona,
+    matching PersonaClassifier._determine_persona.
+
+    Args:
+        passes: bool array of per-metric results for the wallet
+        weights: int64 (metrics x personas) weight matrix
+        max_possible: int64 array of the maximum score per persona
+
+    Returns:
+        Tuple of (best persona index, best percentage score); index is -1 if
+        no persona has any metrics
+    """
+    best_index = -1
+    best_score = -1.0
+    best_total = -1
+    for persona in range(weights.shape[1]):
+        if max_possible[persona] == 0:
+            continue
+        total = 0
+        for metric in range(passes.shape[0]):
+            if passes[metric]:
+                total += weights[metric, persona]
+        score = total / max_possible[persona]
+        if score > best_score or (score == best_score and total > best_total):
+            best_index = persona
+            best_score = score
+            best_total = total
+    return best_index, best_score
+
+
+@njit(cache=True, parallel=True)
+def score_batch(passes, weights, max_possible):
+    """
+    Pick the best persona for every wallet in a batch.
+
+    Wallets are scored independently, so rows are spread across threads.
+
+    Args:
+        passes: bool (wallets x metrics) pass/fail matrix
+        weights: int64 (metrics x personas) weight matrix
+        max_possible: int64 array of the maximum score per persona
+
+    Returns:
+        Tuple of (int64 array of best persona indices, float64 array of scores)
+    """
+    count = passes.shape[0]
+    best_index = np.empty(count, dtype=np.int64)
+    best_score = np.empty(count, dtype=np.float64)
+    for row in prange(count):
+        index, score = score_wallet(passes[row], weights, max_possible)
+        best_index[row] = index
+        best_score[row] = score
+    return best_index, best_score
@@ -5,26 +5,529 @@ This module handles the classification of wallet addresses into different person
 based on their on-chain behavior, portfolio composition, and activity patterns.
 """
 
+import asyncio
+import sys
+from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Dict, Any, Tuple, List
+from operator import itemgetter
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Tuple,
+)
 import json
+import numpy as np
+from cachetools import TTLCache
 from services.activity_service import ActivityService
 from services.portfolio_service import PortfolioService
 
 
+# Persona names, interned so every metric, score table and result shares one
+# object per persona and equality checks short-circuit on identity
+_OG = sys.intern("OG (Conservative)")
+_DEFI_CHAD = sys.intern("DeFi Chad (Moderate)")
+_DEGEN = sys.intern("Degen (Aggressive)")
+_VIRGIN_CT = sys.intern("Virgin CT (Newbie)")
+_UNCLASSIFIED = sys.intern("Unclassified")
+
+# Activity fields copied into the classification criteria, read in one call
+_activity_fields = itemgetter("active_days", "total_transactions")
+_swap_fields = itemgetter("swap_count", "unique_tokens")
+
+# Metric weights, and the labels shown for them in detailed output
+_HIGH, _MEDIUM, _LOW = 3, 2, 1
+_WEIGHT_LABELS = {_HIGH: "High", _MEDIUM: "Medium", _LOW: "Low"}
+_WEIGHT_ICONS = {_HIGH: "🔥", _MEDIUM: "⚡", _LOW: "💡"}
+
+
+class _MetricInputs(NamedTuple):
+    """Every criteria value read by the metric table, extracted once per wallet."""
+
+    token_concentration: float
+    longest_holding_days: int
+    top_value: float
+    wallet_year: Optional[int]
+    has_eth: bool
+    eth_balance: float
+    active_days: int
+    swap_count: int
+    is_top_asset_token_not_eth: bool
+    top_asset: str
+    total_portfolio_value: float
+    total_transactions: int
+
+
+class _MetricSpec(NamedTuple):
+    """Static definition of a single persona metric."""
+
+    persona_type: str
+    metric_name: str
+    description: str
+    calculation: str  # str.format template, receives the actual value as {value}
+    threshold: Any
+    operator: str
+    weight: int
+    condition: str  # Python expression over `inputs` deciding whether it passes
+    evaluate: Callable[[_MetricInputs], Tuple[bool, Any]]  # -> (passes, value)
+
+
+def _criteria_wallet_year(criteria: Dict[str, Any]) -> Optional[int]:
+    """Wallet creation year from criteria, derived from the date if not precomputed."""
+    if "wallet_year" in criteria:
+        return criteria["wallet_year"]
+    wallet_creation = criteria.get("wallet_creation_date")
+    return wallet_creation.year if wallet_creation else None
+
+
+def _metric_inputs(criteria: Dict[str, Any]) -> _MetricInputs:
+    """Extract the values the metric table reads from criteria in a single pass."""
+    get = criteria.get
+    portfolio = get("portfolio")
+    return _MetricInputs(
+        token_concentration=get("token_concentration", 0),
+        longest_holding_days=get("longest_holding_days", 0),
+        top_value=get("top_value", 0),
+        wallet_year=_criteria_wallet_year(criteria),
+        has_eth=get("has_eth", False),
+        eth_balance=portfolio.eth_balance if portfolio else 0,
+        active_days=get("active_days", 0),
+        swap_count=get("swap_count", 0),
+        is_top_asset_token_not_eth=get("is_top_asset_token_not_eth", False),
+        top_asset=get("top_asset", "Unknown"),
+        total_portfolio_value=get("total_portfolio_value", 0),
+        total_transactions=get("total_transactions", 0),
+    )
+
+
+def _compile_inputs_function(name: str, expression: str) -> Callable[..., Any]:
+    """
+    Compile an expression over the metric inputs into a function of them.
+
+    Thresholds are baked into the generated source as literals, so evaluating a
+    metric is straight-line comparisons with no closure or dict lookups.
+
+    Args:
+        name: Name of the generated function
+        expression: Python expression reading the inputs tuple as `inputs`
+
+    Returns:
+        Function taking a _MetricInputs and returning the expression's value
+    """
+    source = f"def {name}(inputs):\n    return {expression}\n"
+    namespace: Dict[str, Any] = {}
+    exec(compile(source, f"<persona metric {name}>", "exec"), namespace)
+    return namespace[name]
+
+
+def _field(name: str) -> str:
+    """Source expression reading one metric input."""
+    return f"inputs[{_MetricInputs._fields.index(name)}]"
+
+
+def _compare(name: str, operator: str, threshold: Any) -> Tuple[str, str]:
+    """Condition and value expressions comparing an input against a threshold."""
+    value = _field(name)
+    return f"{value} {operator} {threshold!r}", value
+
+
+def _between(name: str, low: Any, high: Any) -> Tuple[str, str]:
+    """Condition and value expressions checking an input lies strictly in a range."""
+    value = _field(name)
+    return f"{low!r} < {value} < {high!r}", value
+
+
+def _wallet_year(operator: str, threshold: int, default: int) -> Tuple[str, str]:
+    """Condition and value expressions comparing the wallet creation year."""
+    value = _field("wallet_year")
+    return (
+        f"{value} is not None and {value} {operator} {threshold!r}",
+        f"{default!r} if {value} is None else {value}",
+    )
+
+
+def _flag(name: str, shown: str) -> Tuple[str, str]:
+    """Condition and value expressions for a boolean input shown as another input."""
+    return _field(name), _field(shown)
+
+
+def _metric(
+    persona_type: str,
+    metric_name: str,
+    description: str,
+    calculation: str,
+    threshold: Any,
+    operator: str,
+    weight: int,
+    expressions: Tuple[str, str],
+) -> _MetricSpec:
+    """Build a metric spec, generating its evaluator from (condition, value)."""
+    condition, value = expressions
+    evaluate = _compile_inputs_function("evaluate", f"({condition}), {value}")
+    return _MetricSpec(
+        persona_type,
+        metric_name,
+        description,
+        calculation,
+        threshold,
+        operator,
+        weight,
+        condition,
+        evaluate,
+    )
+
+
+@dataclass(slots=True)
+class MetricResult:
+    """
+    Result of evaluating one persona metric for a wallet.
+
+    Static fields are read from the metric table and the human-readable
+    calculation is only formatted when first accessed.
+    """
+
+    spec: _MetricSpec = field(repr=False)
+    passes: bool
+    actual_value: Any
+    _calculation: Optional[str] = field(default=None, init=False, repr=False)
+
+    @property
+    def persona_type(self) -> str:
+        return self.spec.persona_type
+
+    @property
+    def metric_name(self) -> str:
+        return self.spec.metric_name
+
+    @property
+    def description(self) -> str:
+        return self.spec.description
+
+    @property
+    def threshold(self) -> Any:
+        return self.spec.threshold
+
+    @property
+    def operator(self) -> str:
+        return self.spec.operator
+
+    @property
+    def weight(self) -> str:
+        return _WEIGHT_LABELS[self.spec.weight]
+
+    @property
+    def weight_value(self) -> int:
+        return self.spec.weight
+
+    @property
+    def calculation(self) -> str:
+        if self._calculation is None:
+            self._calculation = self.spec.calculation.format(value=self.actual_value)
+        return self._calculation
+
+    def __getitem__(self, key: str) -> Any:
+        """Support the dict-style access used with the former metric dicts."""
+        return getattr(self, key)
+
+
+# Every metric scored for every persona, in display order
+_METRIC_SPECS: Tuple[_MetricSpec, ...] = (
+    # OG (Conservative)
+    _metric(
+        _OG,
+        "Token Concentration",
+        "Token holding > 60% of portfolio value",
+        "{value:.1%} > 60%",
+        0.6,
+        ">",
+        _HIGH,
+        _compare("token_concentration", ">", 0.6),
+    ),
+    _metric(
+        _OG,
+        "Holding Period",
+        "Longest holding period > 12 months (365 days)",
+        "{value} days > 365 days",
+        365,
+        ">",
+        _HIGH,
+        _compare("longest_holding_days", ">", 365),
+    ),
+    _metric(
+        _OG,
+        "Top Asset Value",
+        "Top asset value < $5,000",
+        "${value:.2f} < $5,000",
+        5000,
+        "<",
+        _MEDIUM,
+        _compare("top_value", "<", 5000),
+    ),
+    _metric(
+        _OG,
+        "Wallet Age",
+        "Wallet created before 2020",
+        "Created in {value} < 2020",
+        2020,
+        "<",
+        _HIGH,
+        _wallet_year("<", 2020, default=9999),
+    ),
+    _metric(
+        _OG,
+        "ETH Holdings",
+        "Currently holding ETH",
+        "ETH Balance: {value:.4f} ETH > 0",
+        0,
+        ">",
+        _MEDIUM,
+        _flag("has_eth", "eth_balance"),
+    ),
+    # DeFi Chad (Moderate)
+    _metric(
+        _DEFI_CHAD,
+        "Holding Period",
+        "Longest holding > 3 months (90 days)",
+        "{value} days > 90 days",
+        90,
+        ">",
+        _HIGH,
+        _compare("longest_holding_days", ">", 90),
+    ),
+    _metric(
+        _DEFI_CHAD,
+        "Token Concentration",
+        "Token holding > 50% of portfolio value",
+        "{value:.1%} > 50%",
+        0.5,
+        ">",
+        _HIGH,
+        _compare("token_concentration", ">", 0.5),
+    ),
+    _metric(
+        _DEFI_CHAD,
+        "Activity Level",
+        "Active > 120 days in last 12 months",
+        "{value} days > 120 days",
+        120,
+        ">",
+        _HIGH,
+        _compare("active_days", ">", 120),
+    ),
+    _metric(
+        _DEFI_CHAD,
+        "Top Asset Value Range",
+        "Top asset value between $2,000 and $5,000",
+        "$2,000 < ${value:.2f} < $5,000",
+        (2000, 5000),
+        "between",
+        _MEDIUM,
+        _between("top_value", 2000, 5000),
+    ),
+    # Degen (Aggressive)
+    _metric(
+        _DEGEN,
+        "High Activity",
+        "Active > 180 days in 12 months",
+        "{value} days > 180 days",
+        180,
+        ">",
+        _HIGH,
+        _compare("active_days", ">", 180),
+    ),
+    _metric(
+        _DEGEN,
+        "Swap Activity",
+        "Over 100 swap transactions in 12 months",
+        "{value} swaps > 100 swaps",
+        100,
+        ">",
+        _HIGH,
+        _compare("swap_count", ">", 100),
+    ),
+    _metric(
+        _DEGEN,
+        "Short Holding Period",
+        "Holding period < 3 months (90 days)",
+        "{value} days < 90 days",
+        90,
+        "<",
+        _HIGH,
+        _compare("longest_holding_days", "<", 90),
+    ),
+    _metric(
+        _DEGEN,
+        "High Token Concentration",
+        "Token holding > 70% of portfolio value",
+        "{value:.1%} > 70%",
+        0.7,
+        ">",
+        _MEDIUM,
+        _compare("token_concentration", ">", 0.7),
+    ),
+    _metric(
+        _DEGEN,
+        "Non-ETH Top Asset",
+        "Top asset is token but not ETH",
+        "Top asset '{value}' is not ETH",
+        "not ETH",
+        "!=",
+        _MEDIUM,
+        _flag("is_top_asset_token_not_eth", "top_asset"),
+    ),
+    # Virgin CT (Newbie)
+    _metric(
+        _VIRGIN_CT,
+        "Recent Wallet",
+        "Wallet created after 2023",
+        "Created in {value} > 2023",
+        2023,
+        ">",
+        _HIGH,
+        _wallet_year(">", 2023, default=0),
+    ),
+    _metric(
+        _VIRGIN_CT,
+        "Moderate Activity",
+        "Active > 30 days in last 12 months",
+        "{value} days > 30 days",
+        30,
+        ">",
+        _MEDIUM,
+        _compare("active_days", ">", 30),
+    ),
+    _metric(
+        _VIRGIN_CT,
+        "Small Portfolio",
+        "Total portfolio value < $5,000",
+        "${value:.2f} < $5,000",
+        5000,
+        "<",
+        _HIGH,
+        _compare("total_portfolio_value", "<", 5000),
+    ),
+    _metric(
+        _VIRGIN_CT,
+        "Low Transaction Count",
+        "Total onchain transactions < 50",
+        "{value} transactions < 50",
+        50,
+        "<",
+        _MEDIUM,
+        _compare("total_transactions", "<", 50),
+    ),
+)
+
+# Every metric condition inlined into one straight-line function returning the
+# pass/fail tuple in metric table order
+_evaluate_passes = _compile_inputs_function(
+    "_evaluate_passes",
+    "(" + ", ".join(f"({spec.condition})" for spec in _METRIC_SPECS) + ",)",
+)
+
+# Persona types in the order they first appear in the metric table
+_PERSONA_TYPES: Tuple[str, ...] = tuple(
+    dict.fromkeys(spec.persona_type for spec in _METRIC_SPECS)
+)
+
+
+def _build_weight_matrix() -> np.ndarray:
+    """Build the (metric x persona) matrix of metric weights used by batch scoring."""
+    matrix = np.zeros((len(_METRIC_SPECS), len(_PERSONA_TYPES)), dtype=np.int64)
+    for row, spec in enumerate(_METRIC_SPECS):
+        column = _PERSONA_TYPES.index(spec.persona_type)
+        matrix[row, column] = spec.weight
+    return matrix
+
+
+_WEIGHT_MATRIX = _build_weight_matrix()
+_MAX_POSSIBLE = _WEIGHT_MATRIX.sum(axis=0)
+
+# (metrics x personas) 0/1 membership and the per-persona constants derived from it
+_MEMBERSHIP_MATRIX = (_WEIGHT_MATRIX > 0).astype(np.int64)
+_MAX_POSSIBLE_SCORES: Tuple[int, ...] = tuple(_MAX_POSSIBLE.tolist())
+_METRIC_COUNTS: Tuple[int, ...] = tuple(_MEMBERSHIP_MATRIX.sum(axis=0).tolist())
+
+
+def _og_criteria(criteria: Dict[str, Any]) -> List[str]:
+    """Criteria check lines shown for the OG persona."""
+    wallet_year = _criteria_wallet_year(criteria)
+    return [
+        f"✓ Token holding > 60%: {criteria.get('token_concentration', 0) > 0.6} ({criteria.get('token_concentration', 0):.1%})",
+        f"✓ Holding period > 12 months: {criteria.get('longest_holding_days', 0) > 365} ({criteria.get('longest_holding_days', 0)} days)",
+        f"✓ Top asset value < $5,000: {criteria.get('top_value', 0) < 5000} (${criteria.get('top_value', 0):.2f})",
+        f"✓ Wallet created < 2020: {wallet_year and wallet_year < 2020} ({wallet_year or 'Unknown'})",
+        f"✓ Holding ETH: {criteria.get('has_eth', False)}",
+    ]
+
+
+def _defi_chad_criteria(criteria: Dict[str, Any]) -> List[str]:
+    """Criteria check lines shown for the DeFi Chad persona."""
+    return [
+        f"✓ Longest holding > 3 months: {criteria.get('longest_holding_days', 0) > 90} ({criteria.get('longest_holding_days', 0)} days)",
+        f"✓ Token holding > 50%: {criteria.get('token_concentration', 0) > 0.5} ({criteria.get('token_concentration', 0):.1%})",
+        f"✓ Active > 120 days: {criteria.get('active_days', 0) > 120} ({criteria.get('active_days', 0)} days)",
+        f"✓ Top asset $2,000-$5,000: {2000 < criteria.get('top_value', 0) < 5000} (${criteria.get('top_value', 0):.2f})",
+    ]
+
+
+def _degen_criteria(criteria: Dict[str, Any]) -> List[str]:
+    """Criteria check lines shown for the Degen persona."""
+    return [
+        f"✓ Active > 180 days: {criteria.get('active_days', 0) > 180} ({criteria.get('active_days', 0)} days)",
+        f"✓ Swaps > 100: {criteria.get('swap_count', 0) > 100} ({criteria.get('swap_count', 0)} swaps)",
+        f"✓ Holding period < 3 months: {criteria.get('longest_holding_days', 0) < 90} ({criteria.get('longest_holding_days', 0)} days)",
+        f"✓ Token holding > 70%: {criteria.get('token_concentration', 0) > 0.7} ({criteria.get('token_concentration', 0):.1%})",
+        f"✓ Top asset is token (not ETH): {criteria.get('is_top_asset_token_not_eth', False)}",
+    ]
+
+
+def _virgin_ct_criteria(criteria: Dict[str, Any]) -> List[str]:
+    """Criteria check lines shown for the Virgin CT persona."""
+    wallet_year = _criteria_wallet_year(criteria)
+    return [
+        f"✓ Wallet created > 2023: {wallet_year and wallet_year > 2023} ({wallet_year or 'Unknown'})",
+        f"✓ Active > 30 days: {criteria.get('active_days', 0) > 30} ({criteria.get('active_days', 0)} days)",
+        f"✓ Portfolio < $5,000: {criteria.get('total_portfolio_value', 0) < 5000} (${criteria.get('total_portfolio_value', 0):.2f})",
+        f"✓ Transactions < 50: {criteria.get('total_transactions', 0) < 50} ({criteria.get('total_transactions', 0)} txs)",
+    ]
+
+
+# Persona-specific criteria check lines, looked up by persona name
+_PERSONA_CRITERIA_LINES: Dict[str, Callable[[Dict[str, Any]], List[str]]] = {
+    _OG: _og_criteria,
+    _DEFI_CHAD: _defi_chad_criteria,
+    _DEGEN: _degen_criteria,
+    _VIRGIN_CT: _virgin_ct_criteria,
+}
+
+
 class PersonaClassifier:
     """Classifier for determining wallet personas based on on-chain behavior."""
 
+    # Activity lookups per address are reused for ACTIVITY_CACHE_TTL seconds
+    ACTIVITY_CACHE_SIZE = 1024
+    ACTIVITY_CACHE_TTL = 60
+
     def __init__(
         self, portfolio_service: PortfolioService, activity_service: ActivityService
     ):
         """Initialize with required services."""
         self.portfolio_service = portfolio_service
         self.activity_service = activity_service
+        self._activity_cache: TTLCache = TTLCache(
+            maxsize=self.ACTIVITY_CACHE_SIZE, ttl=self.ACTIVITY_CACHE_TTL
+        )
+        self._activity_locks: Dict[str, asyncio.Lock] = {}
 
     async def classify_persona_with_details(
-        self, address: str, portfolio=None
-    ) -> Tuple[str, Dict[str, Any], List[Dict[str, Any]]]:
+        self, address: str, portfolio=None, *, now: datetime = None
+    ) -> Tuple[str, Dict[str, Any], List[MetricResult]]:
         """
         Classify persona with detailed metric calculations.
         Returns (persona_name, criteria_details, detailed_metrics)
@@ -32,51 +535,71 @@ class PersonaClassifier:
         Args:
             address: Wallet address to analyze
             portfolio: Optional pre-computed portfolio data to avoid duplicate analysis
+            now: Reference time for wallet age; batch callers can pass one shared
+                value instead of reading the clock per wallet (default: now)
         """
         try:
-            # Get portfolio data (use provided one or fetch it)
+            # Get activity metrics and wallet creation date, fetching the
+            # portfolio data concurrently unless a pre-computed one was provided
             if portfolio is None:
-                portfolio = await self.portfolio_service.analyze_portfolio(address)
-
-            # Get activity metrics
-            activity = await self.activity_service.calculate_activity_score(address)
-            swap_activity = await self.activity_service.analyze_swap_activity(address)
-
-            # Get wallet creation date
-            wallet_creation_date = await self.activity_service.get_wallet_creation_date(
-                address
-            )
+                (activity, swap_activity, wallet_creation_date), portfolio = (
+                    await asyncio.gather(
+                        self.get_activity_lookups(address),
+                        self.portfolio_service.analyze_portfolio(address),
+                    )
+                )
+            else:
+                activity, swap_activity, wallet_creation_date = (
+                    await self.get_activity_lookups(address)
+                )
 
             # Calculate derived metrics
             wallet_age_years = 0
+            wallet_year = None
             if wallet_creation_date:
-                wallet_age_years = (datetime.now() - wallet_creation_date).days / 365.25
-
-            top_asset, top_value = portfolio.top_asset_by_value
+                now = now or datetime.now()
+                wallet_age_years = (now - wallet_creation_date).days / 365.25
+                wallet_year = wallet_creation_date.year
+
+            # Read the holding aggregates once and derive the ratios from them
+            # rather than going back through the portfolio properties per key
+            aggregates = portfolio.compute_aggregates()
+            top_asset = aggregates.top_asset
+            top_value = aggregates.top_asset_value
+            total_value = portfolio.total_value_usd
+            active_days, total_transactions = _activity_fields(activity)
+            swap_count, unique_tokens = _swap_fields(swap_activity)
 
             # Prepare criteria details
             criteria = {
                 "portfolio": portfolio,
                 "wallet_creation_date": wallet_creation_date,
                 "wallet_age_years": wallet_age_years,
-                "active_days": activity["active_days"],
-                "total_transactions": activity["total_transactions"],
-                "swap_count": swap_activity["swap_count"],
-                "unique_tokens": swap_activity["unique_tokens"],
+                "wallet_year": wallet_year,
+                "active_days": active_days,
+                "total_transactions": total_transactions,
+                "swap_count": swap_count,
+                "unique_tokens": unique_tokens,
                 "top_asset": top_asset,
                 "top_value": top_value,
-                "token_concentration": portfolio.token_concentration_ratio,
-                "longest_holding_days": portfolio.longest_holding_period,
+                "token_concentration": (
+                    top_value / total_value if total_value > 0 else 0.0
+                ),
+                "longest_holding_days": aggregates.longest_holding_period,
                 "has_eth": portfolio.eth_balance > 0,
                 "is_top_asset_token_not_eth": portfolio.is_top_asset_token_not_eth,
-                "total_portfolio_value": portfolio.total_value_usd,
+                "total_portfolio_value": total_value,
             }
 
             # Calculate detailed metrics for all persona types
             detailed_metrics = self._calculate_detailed_metrics(criteria)
 
-            # Check personas in priority order
-            persona = self._determine_persona(criteria)
+            # Score every persona and pick the best match
+            persona, persona_scores, best_score = self._determine_persona(
+                criteria, detailed_metrics
+            )
+            criteria["persona_scores"] = persona_scores
+            criteria["best_score"] = best_score
 
             return persona, criteria, detailed_metrics
 
@@ -84,461 +607,203 @@ class PersonaClassifier:
             print(f"Error classifying persona: {e}")
             return "Error", {}, []
 
-    def _calculate_detailed_metrics(
-        self, criteria: Dict[str, Any]
-    ) -> List[Dict[str, Any]]:
-        """Calculate detailed metrics for all persona types."""
-        metrics = []
-
-        # OG (Conservative) Metrics
-        og_metrics = self._calculate_og_metrics(criteria)
-        metrics.extend(og_metrics)
-
-        # DeFi Chad (Moderate) Metrics
-        defi_chad_metrics = self._calculate_defi_chad_metrics(criteria)
-        metrics.extend(defi_chad_metrics)
-
-        # Degen (Aggressive) Metrics
-        degen_metrics = self._calculate_degen_metrics(criteria)
-        metrics.extend(degen_metrics)
-
-        # Virgin CT (Newbie) Metrics
-        virgin_ct_metrics = self._calculate_virgin_ct_metrics(criteria)
-        metrics.extend(virgin_ct_metrics)
-
-        return metrics
-
-    def _calculate_og_metrics(self, criteria: Dict[str, Any]) -> List[Dict[str, Any]]:
-        """Calculate OG (Conservative) persona metrics."""
-        metrics = []
-        persona_type = "OG (Conservative)"
-
-        # Token concentration > 60%
-        token_concentration = criteria.get("token_concentration", 0)
-        metrics.append(
-            {
-                "persona_type": persona_type,
-                "metric_name": "Token Concentration",
-                "description": "Token holding > 60% of portfolio value",
-                "calculation": f"{token_concentration:.1%} > 60%",
-                "actual_value": token_concentration,
-                "threshold": 0.6,
-                "operator": ">",
-                "passes": token_concentration > 0.6,
-                "weight": "High",
-            }
-        )
+    async def get_activity_lookups(
+        self, address: str
+    ) -> Tuple[Dict[str, Any], Dict[str, Any], Optional[datetime]]:
+        """
+        Fetch activity score, swap activity and wallet creation date for an address.
 
-        # Holding period > 12 months
-        longest_holding = criteria.get("longest_holding_days", 0)
-        metrics.append(
-            {
-                "persona_type": persona_type,
-                "metric_name": "Holding Period",
-                "description": "Longest holding period > 12 months (365 days)",
-                "calculation": f"{longest_holding} days > 365 days",
-                "actual_value": longest_holding,
-                "threshold": 365,
-                "operator": ">",
-                "passes": longest_holding > 365,
-                "weight": "High",
-            }
-        )
+        Results are cached per address for ACTIVITY_CACHE_TTL seconds, and
+        concurrent calls for the same address share a single fetch.
 
-        # Top asset value < $5,000
-        top_value = criteria.get("top_value", 0)
-        metrics.append(
-            {
-                "persona_type": persona_type,
-                "metric_name": "Top Asset Value",
-                "description": "Top asset value < $5,000",
-                "calculation": f"${top_value:.2f} < $5,000",
-                "actual_value": top_value,
-                "threshold": 5000,
-                "operator": "<",
-                "passes": top_value < 5000,
-                "weight": "Medium",
-            }
-        )
+        Args:
+            address: Wallet address to analyze
 
-        # Wallet created before 2020
-        wallet_creation = criteria.get("wallet_creation_date")
-        wallet_year = wallet_creation.year if wallet_creation else 9999
-        metrics.append(
-            {
-                "persona_type": persona_type,
-                "metric_name": "Wallet Age",
-                "description": "Wallet created before 2020",
-                "calculation": f"Created in {wallet_year} < 2020",
-                "actual_value": wallet_year,
-                "threshold": 2020,
-                "operator": "<",
-                "passes": wallet_creation and wallet_year < 2020,
-                "weight": "High",
-            }
-        )
+        Returns:
+            Tuple of (activity score, swap activity, wallet creation date)
+        """
+        key = address.lower()
+        cached = self._activity_cache.get(key)
+        if cached is not None:
+            return cached
 
-        # Holding ETH
-        has_eth = criteria.get("has_eth", False)
-        eth_balance = (
-            criteria.get("portfolio").eth_balance if criteria.get("portfolio") else 0
-        )
-        metrics.append(
-            {
-                "persona_type": persona_type,
-                "metric_name": "ETH Holdings",
-                "description": "Currently holding ETH",
-                "calculation": f"ETH Balance: {eth_balance:.4f} ETH > 0",
-                "actual_value": eth_balance,
-                "threshold": 0,
-                "operator": ">",
-                "passes": has_eth,
-                "weight": "Medium",
-            }
-        )
+        lock = self._activity_locks.setdefault(key, asyncio.Lock())
+        try:
+            async with lock:
+                # Another caller may have filled the cache while we waited
+                cached = self._activity_cache.get(key)
+                if cached is None:
+                    cached = tuple(
+                        await asyncio.gather(
+                            self.activity_service.calculate_activity_score(address),
+                            self.activity_service.analyze_swap_activity(address),
+                            self.activity_service.get_wallet_creation_date(address),
+                        )
+                    )
+                    self._activity_cache[key] = cached
+                return cached
+        finally:
+            if not lock.locked():
+                self._activity_locks.pop(key, None)
+
+    def classify_batch(
+        self, criteria_list: List[Dict[str, Any]]
+    ) -> List[Tuple[str, float]]:
+        """
+        Classify many wallets at once using vectorized scoring.
 
-        return metrics
+        Picks the same persona as _determine_persona for every wallet, but
+        scores the whole batch in a compiled kernel instead of per-wallet
+        dictionary bookkeeping.
 
-    def _calculate_defi_chad_metrics(
-        self, criteria: Dict[str, Any]
-    ) -> List[Dict[str, Any]]:
-        """Calculate DeFi Chad (Moderate) persona metrics."""
-        metrics = []
-        persona_type = "DeFi Chad (Moderate)"
-
-        # Longest holding > 3 months
-        longest_holding = criteria.get("longest_holding_days", 0)
-        metrics.append(
-            {
-                "persona_type": persona_type,
-                "metric_name": "Holding Period",
-                "description": "Longest holding > 3 months (90 days)",
-                "calculation": f"{longest_holding} days > 90 days",
-                "actual_value": longest_holding,
-                "threshold": 90,
-                "operator": ">",
-                "passes": longest_holding > 90,
-                "weight": "High",
-            }
-        )
+        Args:
+            criteria_list: Criteria dicts as built by classify_persona_with_details
 
-        # Token concentration > 50%
-        token_concentration = criteria.get("token_concentration", 0)
-        metrics.append(
-            {
-                "persona_type": persona_type,
-                "metric_name": "Token Concentration",
-                "description": "Token holding > 50% of portfolio value",
-                "calculation": f"{token_concentration:.1%} > 50%",
-                "actual_value": token_concentration,
-                "threshold": 0.5,
-                "operator": ">",
-                "passes": token_concentration > 0.5,
-                "weight": "High",
-            }
-        )
+        Returns:
+            List of (persona_name, best percentage score) in input order
+        """
+        count = len(criteria_list)
+        if not count:
+            return []
 
-        # Active > 120 days
-        active_days = criteria.get("active_days", 0)
-        metrics.append(
-            {
-                "persona_type": persona_type,
-                "metric_name": "Activity Level",
-                "description": "Active > 120 days in last 12 months",
-                "calculation": f"{active_days} days > 120 days",
-                "actual_value": active_days,
-                "threshold": 120,
-                "operator": ">",
-                "passes": active_days > 120,
-                "weight": "High",
-            }
-        )
+        # (wallets x metrics) pass/fail matrix, one row per wallet
+        passes = np.empty((count, len(_METRIC_SPECS)), dtype=np.bool_)
+        for row, criteria in enumerate(criteria_list):
+            passes[row] = _evaluate_passes(_metric_inputs(criteria))
 
-        # Top asset value between $2,000-$5,000
-        top_value = criteria.get("top_value", 0)
-        metrics.append(
-            {
-                "persona_type": persona_type,
-                "metric_name": "Top Asset Value Range",
-                "description": "Top asset value between $2,000 and $5,000",
-                "calculation": f"$2,000 < ${top_value:.2f} < $5,000",
-                "actual_value": top_value,
-                "threshold": (2000, 5000),
-                "operator": "between",
-                "passes": 2000 < top_value < 5000,
-                "weight": "Medium",
-            }
-        )
+        best_index, best_score = self.score_batch(passes)
 
-        return metrics
+        return [
+            (_PERSONA_TYPES[index] if index >= 0 else _UNCLASSIFIED, score)
+            for index, score in zip(best_index.tolist(), best_score.tolist())
+        ]
 
-    def _calculate_degen_metrics(
-        self, criteria: Dict[str, Any]
-    ) -> List[Dict[str, Any]]:
-        """Calculate Degen (Aggressive) persona metrics."""
-        metrics = []
-        persona_type = "Degen (Aggressive)"
-
-        # Active > 180 days
-        active_days = criteria.get("active_days", 0)
-        metrics.append(
-            {
-                "persona_type": persona_type,
-                "metric_name": "High Activity",
-                "description": "Active > 180 days in 12 months",
-                "calculation": f"{active_days} days > 180 days",
-                "actual_value": active_days,
-                "threshold": 180,
-                "operator": ">",
-                "passes": active_days > 180,
-                "weight": "High",
-            }
-        )
+    def score_batch(self, passes: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Score a precomputed pass/fail matrix in parallel.
 
-        # Swaps > 100
-        swap_count = criteria.get("swap_count", 0)
-        metrics.append(
-            {
-                "persona_type": persona_type,
-                "metric_name": "Swap Activity",
-                "description": "Over 100 swap transactions in 12 months",
-                "calculation": f"{swap_count} swaps > 100 swaps",
-                "actual_value": swap_count,
-                "threshold": 100,
-                "operator": ">",
-                "passes": swap_count > 100,
-                "weight": "High",
-            }
-        )
+        Args:
+            passes: bool (wallets x metrics) array, columns in metric table order
 
-        # Holding period < 3 months
-        longest_holding = criteria.get("longest_holding_days", 0)
-        metrics.append(
-            {
-                "persona_type": persona_type,
-                "metric_name": "Short Holding Period",
-                "description": "Holding period < 3 months (90 days)",
-                "calculation": f"{longest_holding} days < 90 days",
-                "actual_value": longest_holding,
-                "threshold": 90,
-                "operator": "<",
-                "passes": longest_holding < 90,
-                "weight": "High",
-            }
-        )
+        Returns:
+            Tuple of (best persona index per wallet, best percentage score per
+            wallet); indices refer to persona_types() and are -1 if unscored
+        """
+        # Imported lazily so numba is only loaded when batches are classified
+        from persona._kernels import score_batch
 
-        # Token concentration > 70%
-        token_concentration = criteria.get("token_concentration", 0)
-        metrics.append(
-            {
-                "persona_type": persona_type,
-                "metric_name": "High Token Concentration",
-                "description": "Token holding > 70% of portfolio value",
-                "calculation": f"{token_concentration:.1%} > 70%",
-                "actual_value": token_concentration,
-                "threshold": 0.7,
-                "operator": ">",
-                "passes": token_concentration > 0.7,
-                "weight": "Medium",
-            }
+        return score_batch(
+            np.ascontiguousarray(passes, dtype=np.bool_), _WEIGHT_MATRIX, _MAX_POSSIBLE
         )
 
-        # Top asset is token (not ETH)
-        is_top_asset_token_not_eth = criteria.get("is_top_asset_token_not_eth", False)
-        top_asset = criteria.get("top_asset", "Unknown")
-        metrics.append(
-            {
-                "persona_type": persona_type,
-                "metric_name": "Non-ETH Top Asset",
-                "description": "Top asset is token but not ETH",
-                "calculation": f"Top asset '{top_asset}' is not ETH",
-                "actual_value": top_asset,
-                "threshold": "not ETH",
-                "operator": "!=",
-                "passes": is_top_asset_token_not_eth,
-                "weight": "Medium",
-            }
-        )
+    @staticmethod
+    def persona_types() -> Tuple[str, ...]:
+        """Persona types in the column order used by score_batch."""
+        return _PERSONA_TYPES
 
-        return metrics
+    def _iter_detailed_metrics(
+        self, criteria: Dict[str, Any]
+    ) -> Iterator[MetricResult]:
+        """Yield detailed metrics for all persona types, in metric table order."""
+        inputs = _metric_inputs(criteria)
+        for spec in _METRIC_SPECS:
+            yield MetricResult(spec, *spec.evaluate(inputs))
 
-    def _calculate_virgin_ct_metrics(
+    def _calculate_detailed_metrics(
         self, criteria: Dict[str, Any]
-    ) -> List[Dict[str, Any]]:
-        """Calculate Virgin CT (Newbie) persona metrics."""
-        metrics = []
-        persona_type = "Virgin CT (Newbie)"
+    ) -> List[MetricResult]:
+        """Calculate detailed metrics for all persona types."""
+        return list(self._iter_detailed_metrics(criteria))
 
-        # Wallet created after 2023
-        wallet_creation = criteria.get("wallet_creation_date")
-        wallet_year = wallet_creation.year if wallet_creation else 0
-        metrics.append(
-            {
-                "persona_type": persona_type,
-                "metric_name": "Recent Wallet",
-                "description": "Wallet created after 2023",
-                "calculation": f"Created in {wallet_year} > 2023",
-                "actual_value": wallet_year,
-                "threshold": 2023,
-                "operator": ">",
-                "passes": wallet_creation and wallet_year > 2023,
-                "weight": "High",
-            }
-        )
+    def _determine_persona(
+        self,
+        criteria: Dict[str, Any],
+        detailed_metrics: Iterable[MetricResult] = None,
+    ) -> Tuple[str, Dict[str, Dict[str, int]], float]:
+        """
+        Determine persona based on weighted scoring of all criteria.
 
-        # Active > 30 days
-        active_days = criteria.get("active_days", 0)
-        metrics.append(
-            {
-                "persona_type": persona_type,
-                "metric_name": "Moderate Activity",
-                "description": "Active > 30 days in last 12 months",
-                "calculation": f"{active_days} days > 30 days",
-                "actual_value": active_days,
-                "threshold": 30,
-                "operator": ">",
-                "passes": active_days > 30,
-                "weight": "Medium",
-            }
-        )
+        Args:
+            criteria: Wallet criteria to score
+            detailed_metrics: Optional metrics already computed for these criteria,
+                in metric table order
 
-        # Portfolio value < $5,000
-        portfolio_value = criteria.get("total_portfolio_value", 0)
-        metrics.append(
-            {
-                "persona_type": persona_type,
-                "metric_name": "Small Portfolio",
-                "description": "Total portfolio value < $5,000",
-                "calculation": f"${portfolio_value:.2f} < $5,000",
-                "actual_value": portfolio_value,
-                "threshold": 5000,
-                "operator": "<",
-                "passes": portfolio_value < 5000,
-                "weight": "High",
-            }
-        )
+        Returns:
+            Tuple of (persona_name, per-persona scores ranked best first, best
+            percentage score)
+        """
+        # Pass/fail vector in metric table order, evaluated straight from the
+        # table unless the caller already has the metrics
+        if detailed_metrics is None:
+            passes = np.fromiter(
+                _evaluate_passes(_metric_inputs(criteria)),
+                dtype=np.bool_,
+                count=len(_METRIC_SPECS),
+            )
+        else:
+            passes = np.fromiter(
+                (metric.passes for metric in detailed_metrics), dtype=np.bool_
+            )
 
-        # Total transactions < 50
-        total_transactions = criteria.get("total_transactions", 0)
-        metrics.append(
-            {
-                "persona_type": persona_type,
-                "metric_name": "Low Transaction Count",
-                "description": "Total onchain transactions < 50",
-                "calculation": f"{total_transactions} transactions < 50",
-                "actual_value": total_transactions,
-                "threshold": 50,
-                "operator": "<",
-                "passes": total_transactions < 50,
-                "weight": "Medium",
-            }
+        # Weighted scores and passed counts per persona from two small products
+        total_scores = (passes @ _WEIGHT_MATRIX).tolist()
+        passed_counts = (passes @ _MEMBERSHIP_MATRIX).tolist()
+
+        # Compute each percentage score once and keep the personas ranked by it
+        # (ties in table order), so display code can iterate without re-sorting
+        ranked = sorted(
+            (
+                (
+                    score / max_score if max_score > 0 else 0,
+                    persona_type,
+                    score,
+                    max_score,
+                    passed,
+                    count,
+                )
+                for persona_type, score, max_score, passed, count in zip(
+                    _PERSONA_TYPES,
+                    total_scores,
+                    _MAX_POSSIBLE_SCORES,
+                    passed_counts,
+                    _METRIC_COUNTS,
+                )
+            ),
+            key=itemgetter(0),
+            reverse=True,
         )
+        persona_scores = {
+            persona_type: {
+                "total_score": score,
+                "max_possible": max_score,
+                "passed_metrics": passed,
+                "total_metrics": count,
+                "score_ratio": ratio,
+            }
+            for ratio, persona_type, score, max_score, passed, count in ranked
+        }
 
-        return metrics
-
-    def _determine_persona(self, criteria: Dict[str, Any]) -> str:
-        """Determine persona based on weighted scoring of all criteria."""
-        # Calculate detailed metrics for scoring
-        detailed_metrics = self._calculate_detailed_metrics(criteria)
-
-        # Group metrics by persona type and calculate weighted scores
-        persona_scores = {}
-        weight_values = {"High": 3, "Medium": 2, "Low": 1}
-
-        for metric in detailed_metrics:
-            persona_type = metric["persona_type"]
-            if persona_type not in persona_scores:
-                persona_scores[persona_type] = {
-                    "total_score": 0,
-                    "max_possible": 0,
-                    "passed_metrics": 0,
-                    "total_metrics": 0,
-                }
-
-            weight_value = weight_values.get(metric["weight"], 1)
-            persona_scores[persona_type]["max_possible"] += weight_value
-            persona_scores[persona_type]["total_metrics"] += 1
-
-            if metric["passes"]:
-                persona_scores[persona_type]["total_score"] += weight_value
-                persona_scores[persona_type]["passed_metrics"] += 1
-
-        # Calculate percentage scores and find the best match
+        # Find the best match
         best_persona = None
         best_score = -1
+        best_total = -1
 
-        for persona_type, scores in persona_scores.items():
-            if scores["max_possible"] > 0:
-                percentage_score = scores["total_score"] / scores["max_possible"]
-
+        for percentage_score, persona_type, score, max_score, _, _ in ranked:
+            if max_score > 0:
                 # Prefer personas with higher percentage scores
                 # In case of ties, prefer the one with more total points
                 if percentage_score > best_score or (
-                    percentage_score == best_score
-                    and scores["total_score"]
-                    > persona_scores[best_persona]["total_score"]
+                    percentage_score == best_score and score > best_total
                 ):
                     best_score = percentage_score
+                    best_total = score
                     best_persona = persona_type
 
-        # Store scoring details for later use in formatting
-        self._last_persona_scores = persona_scores
-        self._last_best_score = best_score
-
-        return best_persona if best_persona else "Unclassified"
-
-    def _determine_persona_legacy(self, criteria: Dict[str, Any]) -> str:
-        """Legacy persona determination logic (kept for reference)."""
-        portfolio = criteria.get("portfolio")
-        activity = criteria
-        wallet_creation_date = criteria.get("wallet_creation_date")
-
-        # 1. OG (Conservative)
-        if (
-            criteria.get("token_concentration", 0) > 0.6
-            and criteria.get("longest_holding_days", 0) > 365
-            and criteria.get("top_value", 0) < 5000
-            and wallet_creation_date
-            and wallet_creation_date.year < 2020
-            and criteria.get("has_eth", False)
-        ):
-            return "OG (Conservative)"
-
-        # 2. DeFi Chad (Moderate)
-        if (
-            criteria.get("longest_holding_days", 0) > 90
-            and criteria.get("token_concentration", 0) > 0.5
-            and criteria.get("active_days", 0) > 120
-            and 2000 < criteria.get("top_value", 0) < 5000
-        ):
-            return "DeFi Chad (Moderate)"
-
-        # 3. Degen (Aggressive)
-        if (
-            criteria.get("active_days", 0) > 180
-            and criteria.get("swap_count", 0) > 100
-            and criteria.get("longest_holding_days", 0) < 90
-            and criteria.get("token_concentration", 0) > 0.7
-            and criteria.get("is_top_asset_token_not_eth", False)
-        ):
-            return "Degen (Aggressive)"
-
-        # 4. Virgin CT (Newbie)
-        if (
-            wallet_creation_date
-            and wallet_creation_date.year > 2023
-            and criteria.get("active_days", 0) > 30
-            and criteria.get("total_portfolio_value", 0) < 5000
-            and criteria.get("total_transactions", 0) < 50
-        ):
-            return "Virgin CT (Newbie)"
-
-        # Default: Unclassified
-        return "Unclassified"
+        return best_persona or _UNCLASSIFIED, persona_scores, best_score
 
     # Keep the original methods for backward compatibility
     async def classify_persona(
-        self, address: str, portfolio=None
+        self, address: str, portfolio=None, *, now: datetime = None
     ) -> Tuple[str, Dict[str, Any]]:
         """
         Dynamically classify user persona based on comprehensive criteria.
@@ -547,56 +812,75 @@ class PersonaClassifier:
         Args:
             address: Wallet address to analyze
             portfolio: Optional pre-computed portfolio data to avoid duplicate analysis
+            now: Reference time for wallet age (default: now)
         """
         persona, criteria, _ = await self.classify_persona_with_details(
-            address, portfolio
+            address, portfolio, now=now
         )
         return persona, criteria
 
     def format_detailed_metrics(
-        self, detailed_metrics: List[Dict[str, Any]], target_persona: str = None
+        self, detailed_metrics: List[MetricResult], target_persona: str = None
     ) -> str:
         """Format detailed metrics for display."""
         if not detailed_metrics:
             return "❌ No detailed metrics available"
 
-        output = []
+        sections = self.format_detailed_metric_sections(detailed_metrics)
+        if target_persona:
+            return sections.get(target_persona, "")
+        return "\n".join(sections.values())
+
+    def format_detailed_metric_sections(
+        self, detailed_metrics: Iterable[MetricResult]
+    ) -> Dict[str, str]:
+        """
+        Format the detailed metrics of each persona type as its own section.
 
-        # Group metrics by persona type
+        Lets callers showing one persona's metrics alongside the full
+        comparison format every section only once.
+
+        Args:
+            detailed_metrics: Metric results to format
+
+        Returns:
+            Formatted section per persona type, in metric table order
+        """
+        sections = {}
+
+        # Group metrics by persona type, counting passes as they are grouped
         persona_metrics = {}
+        passed_counts = {}
         for metric in detailed_metrics:
-            persona_type = metric["persona_type"]
+            persona_type = metric.persona_type
             if persona_type not in persona_metrics:
                 persona_metrics[persona_type] = []
+                passed_counts[persona_type] = 0
             persona_metrics[persona_type].append(metric)
+            passed_counts[persona_type] += metric.passes
 
         # Display metrics for each persona type
         for persona_type, metrics in persona_metrics.items():
-            if target_persona and persona_type != target_persona:
-                continue
-
-            output.append(f"\n🔍 === {persona_type.upper()} METRICS ===")
+            output = [f"\n🔍 === {persona_type.upper()} METRICS ==="]
 
-            passed_count = sum(1 for m in metrics if m["passes"])
+            passed_count = passed_counts[persona_type]
             total_count = len(metrics)
 
             output.append(f"Overall Score: {passed_count}/{total_count} criteria met")
 
             for metric in metrics:
-                status = "✅" if metric["passes"] else "❌"
-                weight_icon = (
-                    "🔥"
-                    if metric["weight"] == "High"
-                    else "⚡" if metric["weight"] == "Medium" else "💡"
-                )
+                status = "✅" if metric.passes else "❌"
+                weight_icon = _WEIGHT_ICONS[metric.weight_value]
 
-                output.append(f"\n{status} {weight_icon} {metric['metric_name']}")
-                output.append(f"   Description: {metric['description']}")
-                output.append(f"   Calculation: {metric['calculation']}")
-                output.append(f"   Result: {'PASS' if metric['passes'] else 'FAIL'}")
-                output.append(f"   Weight: {metric['weight']}")
+                output.append(f"\n{status} {weight_icon} {metric.metric_name}")
+                output.append(f"   Description: {metric.description}")
+                output.append(f"   Calculation: {metric.calculation}")
+                output.append(f"   Result: {'PASS' if metric.passes else 'FAIL'}")
+                output.append(f"   Weight: {metric.weight}")
 
-        return "\n".join(output)
+            sections[persona_type] = "\n".join(output)
+
+        return sections
 
     def format_persona_analysis(self, persona: str, criteria: Dict[str, Any]) -> str:
         """Format persona analysis results for display."""
@@ -610,9 +894,12 @@ class PersonaClassifier:
         output = []
 
         # Header with confidence score
+        persona_scores = criteria.get("persona_scores")
+        best_score = criteria.get("best_score")
+
         confidence_info = ""
-        if hasattr(self, "_last_persona_scores") and hasattr(self, "_last_best_score"):
-            confidence_percentage = self._last_best_score * 100
+        if persona_scores is not None and best_score is not None:
+            confidence_percentage = best_score * 100
             if confidence_percentage >= 80:
                 confidence_emoji = "🎯"
                 confidence_level = "High"
@@ -628,27 +915,19 @@ class PersonaClassifier:
 
             confidence_info = f" | {confidence_emoji} {confidence_level} Confidence ({confidence_percentage:.1f}%)"
 
-        if persona == "Unclassified":
+        if persona == _UNCLASSIFIED:
             output.append(f"❓ PERSONA: UNCLASSIFIED{confidence_info}")
         else:
             output.append(f"🎯 PERSONA: {persona.upper()}{confidence_info}")
 
         # Add scoring summary if available
-        if hasattr(self, "_last_persona_scores"):
+        if persona_scores is not None:
             output.append("\n=== Persona Scoring Summary ===")
-            sorted_personas = sorted(
-                self._last_persona_scores.items(),
-                key=lambda x: (
-                    x[1]["total_score"] / x[1]["max_possible"]
-                    if x[1]["max_possible"] > 0
-                    else 0
-                ),
-                reverse=True,
-            )
 
-            for i, (persona_type, scores) in enumerate(sorted_personas, 1):
+            # Scores are already ranked best first by _determine_persona
+            for i, (persona_type, scores) in enumerate(persona_scores.items(), 1):
                 if scores["max_possible"] > 0:
-                    percentage = (scores["total_score"] / scores["max_possible"]) * 100
+                    percentage = scores["score_ratio"] * 100
                     status = "👑" if i == 1 else f"{i}."
                     output.append(
                         f"{status} {persona_type}: {scores['total_score']}/{scores['max_possible']} points "
@@ -693,64 +972,8 @@ class PersonaClassifier:
         # Persona-specific criteria check
         output.append(f"\n=== {persona} Criteria Analysis ===")
 
-        if persona == "OG (Conservative)":
-            output.append(
-                f"✓ Token holding > 60%: {criteria.get('token_concentration', 0) > 0.6} ({criteria.get('token_concentration', 0):.1%})"
-            )
-            output.append(
-                f"✓ Holding period > 12 months: {criteria.get('longest_holding_days', 0) > 365} ({criteria.get('longest_holding_days', 0)} days)"
-            )
-            output.append(
-                f"✓ Top asset value < $5,000: {criteria.get('top_value', 0) < 5000} (${criteria.get('top_value', 0):.2f})"
-            )
-            output.append(
-                f"✓ Wallet created < 2020: {wallet_creation and wallet_creation.year < 2020} ({wallet_creation.year if wallet_creation else 'Unknown'})"
-            )
-            output.append(f"✓ Holding ETH: {criteria.get('has_eth', False)}")
-
-        elif persona == "DeFi Chad (Moderate)":
-            output.append(
-                f"✓ Longest holding > 3 months: {criteria.get('longest_holding_days', 0) > 90} ({criteria.get('longest_holding_days', 0)} days)"
-            )
-            output.append(
-                f"✓ Token holding > 50%: {criteria.get('token_concentration', 0) > 0.5} ({criteria.get('token_concentration', 0):.1%})"
-            )
-            output.append(
-                f"✓ Active > 120 days: {criteria.get('active_days', 0) > 120} ({criteria.get('active_days', 0)} days)"
-            )
-            output.append(
-                f"✓ Top asset $2,000-$5,000: {2000 < criteria.get('top_value', 0) < 5000} (${criteria.get('top_value', 0):.2f})"
-            )
-
-        elif persona == "Degen (Aggressive)":
-            output.append(
-                f"✓ Active > 180 days: {criteria.get('active_days', 0) > 180} ({criteria.get('active_days', 0)} days)"
-            )
-            output.append(
-                f"✓ Swaps > 100: {criteria.get('swap_count', 0) > 100} ({criteria.get('swap_count', 0)} swaps)"
-            )
-            output.append(
-                f"✓ Holding period < 3 months: {criteria.get('longest_holding_days', 0) < 90} ({criteria.get('longest_holding_days', 0)} days)"
-            )
-            output.append(
-                f"✓ Token holding > 70%: {criteria.get('token_concentration', 0) > 0.7} ({criteria.get('token_concentration', 0):.1%})"
-            )
-            output.append(
-                f"✓ Top asset is token (not ETH): {criteria.get('is_top_asset_token_not_eth', False)}"
-            )
-
-        elif persona == "Virgin CT (Newbie)":
-            output.append(
-                f"✓ Wallet created > 2023: {wallet_creation and wallet_creation.year > 2023} ({wallet_creation.year if wallet_creation else 'Unknown'})"
-            )
-            output.append(
-                f"✓ Active > 30 days: {criteria.get('active_days', 0) > 30} ({criteria.get('active_days', 0)} days)"
-            )
-            output.append(
-                f"✓ Portfolio < $5,000: {criteria.get('total_portfolio_value', 0) < 5000} (${criteria.get('total_portfolio_value', 0):.2f})"
-            )
-            output.append(
-                f"✓ Transactions < 50: {criteria.get('total_transactions', 0) < 50} ({criteria.get('total_transactions', 0)} txs)"
-            )
+        criteria_lines = _PERSONA_CRITERIA_LINES.get(persona)
+        if criteria_lines is not None:
+            output.extend(criteria_lines(criteria))
 
         return "\n".join(output)
@@ -6,10 +6,14 @@ The analyzer coordinates between different services to provide comprehensive
 wallet analysis and persona classification with detailed metric calculations.
 """
 
-import os
 import asyncio
-from adapters.etherscan import EtherscanAdapter
-from adapters.zerion import ZerionAdapter
+import sys
+from collections import Counter
+from datetime import datetime
+from typing import Optional, Tuple
+
+import aiohttp
+from adapters.async_base import AsyncBaseAdapter
 from services.portfolio_service import PortfolioService
 from services.activity_service import ActivityService
 from persona.persona_classifier import PersonaClassifier
@@ -18,10 +22,19 @@ from persona.persona_classifier import PersonaClassifier
 class PortfolioAnalyzer:
     """Main portfolio analyzer coordinating all services."""
 
+    # Wallets analyzed at once by analyze_multiple_wallets (explorer rate limits)
+    MAX_CONCURRENT_WALLETS = 5
+
+    # Seconds one wallet's analysis may take in analyze_multiple_wallets before
+    # it is abandoned; longer than a Zerion request (120s timeout) through all
+    # of its default four attempts and their backoff
+    WALLET_TIMEOUT = 600
+
     def __init__(self, etherscan_adapter, zerion_adapter=None):
         """Initialize with adapters."""
         self.etherscan_adapter = etherscan_adapter
         self.zerion_adapter = zerion_adapter
+        self._session = None
 
         # Initialize services
         self.portfolio_service = PortfolioService(etherscan_adapter, zerion_adapter)
@@ -32,6 +45,18 @@ class PortfolioAnalyzer:
 
     async def __aenter__(self):
         """Async context manager entry."""
+        # One session (and connection pool) shared by both adapters and pricing
+        # for every wallet analyzed inside this context; the pool uses the
+        # adapters' limits and keep-alive so idle sockets are reused by the
+        # next wallet in a batch
+        self._session = aiohttp.ClientSession(
+            connector=AsyncBaseAdapter.create_connector()
+        )
+        self.etherscan_adapter.use_session(self._session)
+        if self.zerion_adapter:
+            self.zerion_adapter.use_session(self._session)
+        self.portfolio_service.use_session(self._session)
+
         await self.portfolio_service.__aenter__()
         return self
 
@@ -39,8 +64,19 @@ class PortfolioAnalyzer:
         """Async context manager exit."""
         await self.portfolio_service.__aexit__(exc_type, exc_val, exc_tb)
 
+        # Detach the adapters, then close the shared session
+        await self.etherscan_adapter.aclose()
+        if self.zerion_adapter:
+            await self.zerion_adapter.aclose()
+        await self._session.close()
+
     async def analyze_wallet(
-        self, address: str, show_detailed_metrics: bool = True
+        self,
+        address: str,
+        show_detailed_metrics: bool = True,
+        *,
+        now: datetime = None,
+        timeout: float = None,
     ) -> dict:
         """
         Perform comprehensive wallet analysis including portfolio and persona classification.
@@ -48,64 +84,65 @@ class PortfolioAnalyzer:
         Args:
             address: Wallet address to analyze
             show_detailed_metrics: Whether to display detailed metric calculations
+            now: Reference time for wallet age (default: now)
+            timeout: Seconds before the analysis is cancelled
+                (default: no limit)
 
         Returns:
             Dictionary containing portfolio data, activity metrics, and persona classification
         """
+        if timeout is None:
+            return await self._analyze_wallet(address, show_detailed_metrics, now)
+
+        try:
+            return await asyncio.wait_for(
+                self._analyze_wallet(address, show_detailed_metrics, now), timeout
+            )
+        except asyncio.TimeoutError:
+            print(f"❌ Error analyzing wallet {address}: timed out after {timeout}s")
+            return self._error_result(address, f"Timed out after {timeout}s")
+
+    async def _analyze_wallet(
+        self, address: str, show_detailed_metrics: bool, now: Optional[datetime]
+    ) -> dict:
+        """Run the wallet analysis for analyze_wallet, without a time limit."""
         try:
             print(f"\n🔍 Analyzing wallet: {address}")
             print("=" * 60)
 
-            # Get portfolio analysis
-            print("📊 Fetching portfolio data...")
-            portfolio = await self.portfolio_service.analyze_portfolio(address)
-
-            # Get activity metrics
-            print("⚡ Calculating activity metrics...")
-            activity = await self.activity_service.calculate_activity_score(address)
-            swap_activity = await self.activity_service.analyze_swap_activity(address)
-            wallet_creation_date = await self.activity_service.get_wallet_creation_date(
-                address
+            # Get portfolio analysis and activity metrics concurrently
+            print("📊 Fetching portfolio data and calculating activity metrics...")
+            # The activity lookups go through the classifier's per-address cache,
+            # so classification below reuses them instead of fetching again.
+            # Both are allowed to finish even if the other fails.
+            portfolio, lookups = await asyncio.gather(
+                self.portfolio_service.analyze_portfolio(address),
+                self.persona_classifier.get_activity_lookups(address),
+                return_exceptions=True,
             )
+            for outcome in (portfolio, lookups):
+                if isinstance(outcome, BaseException):
+                    raise outcome
+            activity, swap_activity, wallet_creation_date = lookups
 
             # Classify persona with detailed metrics (pass the already-computed portfolio)
             print("🎯 Classifying persona with detailed calculations...")
             persona, persona_details, detailed_metrics = (
                 await self.persona_classifier.classify_persona_with_details(
-                    address, portfolio
+                    address, portfolio, now=now
                 )
             )
 
-            # Display detailed metrics if requested
-            if show_detailed_metrics:
-                print("\n" + "=" * 60)
-                print("🔬 DETAILED METRIC CALCULATIONS")
-                print("=" * 60)
-
-                # Show metrics for the classified persona first
-                if persona != "Unclassified" and persona != "Error":
-                    print(f"\n🎯 CLASSIFIED AS: {persona.upper()}")
-                    detailed_output = self.persona_classifier.format_detailed_metrics(
-                        detailed_metrics, target_persona=persona
-                    )
-                    print(detailed_output)
-
-                # Show all persona metrics for comparison
-                print(f"\n📋 ALL PERSONA METRICS COMPARISON")
-                print("-" * 40)
-                all_metrics_output = self.persona_classifier.format_detailed_metrics(
-                    detailed_metrics
-                )
-                print(all_metrics_output)
-
-            # Display traditional persona analysis
-            print("\n" + "=" * 60)
-            print("📈 PERSONA ANALYSIS SUMMARY")
-            print("=" * 60)
-            formatted_analysis = self.persona_classifier.format_persona_analysis(
-                persona, persona_details
+            # Format the report off the event loop so concurrent analyses keep
+            # making progress, then write it in one call
+            report, formatted_analysis = await asyncio.to_thread(
+                self._format_report,
+                persona,
+                persona_details,
+                detailed_metrics,
+                show_detailed_metrics,
             )
-            print(formatted_analysis)
+            sys.stdout.write(report)
 
             return {
                 "address": address,
@@ -121,84 +158,165 @@ class PortfolioAnalyzer:
                     "classification": persona,
                     "details": persona_details,
                     "detailed_metrics": detailed_metrics,
+                    "persona_scores": persona_details.get("persona_scores"),
+                    "best_score": persona_details.get("best_score"),
                     "formatted_analysis": formatted_analysis,
                 },
             }
 
         except Exception as e:
             print(f"❌ Error analyzing wallet {address}: {e}")
-            return {
-                "address": address,
-                "error": str(e),
-                "portfolio": None,
-                "activity": None,
-                "persona": None,
-            }
+            return self._error_result(address, str(e))
+
+    @staticmethod
+    def _error_result(address: str, error: str) -> dict:
+        """Result returned in place of an analysis that failed."""
+        return {
+            "address": address,
+            "error": error,
+            "portfolio": None,
+            "activity": None,
+            "persona": None,
+        }
+
+    def _format_report(
+        self,
+        persona: str,
+        persona_details: dict,
+        detailed_metrics: list,
+        show_detailed_metrics: bool,
+    ) -> Tuple[str, str]:
+        """
+        Build the printable report for one analyzed wallet.
+
+        Args:
+            persona: Classified persona name
+            persona_details: Criteria details from the classifier
+            detailed_metrics: Detailed metric results from the classifier
+            show_detailed_metrics: Whether to include detailed metric calculations
+
+        Returns:
+            Tuple of (full report text, formatted persona analysis)
+        """
+        report = []
+
+        # Display detailed metrics if requested
+        if show_detailed_metrics:
+            report.append("\n" + "=" * 60)
+            report.append("🔬 DETAILED METRIC CALCULATIONS")
+            report.append("=" * 60)
+
+            # Format each persona's section once; the classified persona's
+            # section is shown first and again in the comparison
+            if detailed_metrics:
+                sections = self.persona_classifier.format_detailed_metric_sections(
+                    detailed_metrics
+                )
+                detailed_output = sections.get(persona, "")
+                all_metrics_output = "\n".join(sections.values())
+            else:
+                detailed_output = all_metrics_output = (
+                    self.persona_classifier.format_detailed_metrics(detailed_metrics)
+                )
+
+            # Show metrics for the classified persona first
+            if persona != "Unclassified" and persona != "Error":
+                report.append(f"\n🎯 CLASSIFIED AS: {persona.upper()}")
+                report.append(detailed_output)
+
+            # Show all persona metrics for comparison
+            report.append(f"\n📋 ALL PERSONA METRICS COMPARISON")
+            report.append("-" * 40)
+            report.append(all_metrics_output)
+
+        # Display traditional persona analysis
+        report.append("\n" + "=" * 60)
+        report.append("📈 PERSONA ANALYSIS SUMMARY")
+        report.append("=" * 60)
+        formatted_analysis = self.persona_classifier.format_persona_analysis(
+            persona, persona_details
+        )
+        report.append(formatted_analysis)
+
+        return "\n".join(report) + "\n", formatted_analysis
 
     async def analyze_multiple_wallets(
-        self, addresses: list, show_detailed_metrics: bool = False
+        self,
+        addresses: list,
+        show_detailed_metrics: bool = False,
+        concurrency: int = None,
+        timeout: float = None,
     ) -> dict:
         """
         Analyze multiple wallets and return aggregated results.
 
+        Wallets are analyzed concurrently, at most concurrency at a time.
+
         Args:
             addresses: List of wallet addresses to analyze
             show_detailed_metrics: Whether to show detailed metrics for each wallet
+            concurrency: Maximum wallets analyzed at once
+                (default: MAX_CONCURRENT_WALLETS)
+            timeout: Seconds before one wallet's analysis is cancelled
+                (default: WALLET_TIMEOUT)
 
         Returns:
             Dictionary with individual results and summary statistics
         """
-        results = {}
-        persona_counts = {}
+        # One reference time for every wallet's age in this batch
+        now = datetime.now()
+        semaphore = asyncio.Semaphore(concurrency or self.MAX_CONCURRENT_WALLETS)
+        if timeout is None:
+            timeout = self.WALLET_TIMEOUT
 
         print(f"\n🚀 Starting analysis of {len(addresses)} wallets...")
         print("=" * 60)
 
-        for i, address in enumerate(addresses, 1):
-            print(f"\n[{i}/{len(addresses)}] Analyzing wallet: {address}")
-            result = await self.analyze_wallet(address, show_detailed_metrics)
-            results[address] = result
+        async def analyze(i: int, address: str) -> dict:
+            async with semaphore:
+                print(f"\n[{i}/{len(addresses)}] Analyzing wallet: {address}")
+                return await self.analyze_wallet(
+                    address, show_detailed_metrics, now=now, timeout=timeout
+                )
 
-            # Count personas
-            if result.get("persona") and result["persona"].get("classification"):
-                persona = result["persona"]["classification"]
-                persona_counts[persona] = persona_counts.get(persona, 0) + 1
+        outcomes = await asyncio.gather(
+            *(analyze(i, address) for i, address in enumerate(addresses, 1))
+        )
+        results = dict(zip(addresses, outcomes))
+
+        # Count personas
+        persona_counts = Counter(
+            result["persona"]["classification"]
+            for result in outcomes
+            if result.get("persona") and result["persona"].get("classification")
+        )
+        ranked_personas = persona_counts.most_common()
+        most_common = ranked_personas[0][0] if ranked_personas else "None"
+        failed = sum(1 for r in results.values() if r.get("error"))
+        successful = len(results) - failed
 
         # Display summary
         print("\n" + "=" * 60)
         print("📊 BATCH ANALYSIS SUMMARY")
         print("=" * 60)
         print(f"Total wallets analyzed: {len(addresses)}")
-        print(
-            f"Successful analyses: {len([r for r in results.values() if not r.get('error')])}"
-        )
-        print(
-            f"Failed analyses: {len([r for r in results.values() if r.get('error')])}"
-        )
+        print(f"Successful analyses: {successful}")
+        print(f"Failed analyses: {failed}")
 
-        if persona_counts:
+        if ranked_personas:
             print(f"\n🎯 Persona Distribution:")
-            for persona, count in sorted(
-                persona_counts.items(), key=lambda x: x[1], reverse=True
-            ):
+            for persona, count in ranked_personas:
                 percentage = (count / len(addresses)) * 100
                 print(f"  {persona}: {count} wallets ({percentage:.1f}%)")
 
-            most_common = max(persona_counts.items(), key=lambda x: x[1])[0]
             print(f"\n🏆 Most common persona: {most_common}")
 
         return {
             "individual_results": results,
             "summary": {
                 "total_wallets": len(addresses),
-                "successful_analyses": len(
-                    [r for r in results.values() if not r.get("error")]
-                ),
-                "persona_distribution": persona_counts,
-                "most_common_persona": (
-                    max(persona_counts.items(), key=lambda x: x[1])[0]
-                    if persona_counts
-                    else "None"
-                ),
+                "successful_analyses": successful,
+                "persona_distribution": dict(persona_counts),
+                "most_common_persona": most_common,
             },
         }
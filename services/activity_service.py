@@ -5,9 +5,34 @@ This service handles transaction analysis, swap detection, and activity scoring
 for wallet addresses using blockchain data.
 """
 
+from bisect import bisect_left
 from datetime import datetime, timedelta
-from typing import Dict, Any, Optional
-from collections import defaultdict
+from typing import Dict, Any, List, Optional
+
+import numpy as np
+
+# Every UTC offset in use is a whole number of quarter hours, so all timestamps
+# in one epoch-aligned quarter-hour bucket fall on the same local calendar day
+_LOCAL_DAY_BUCKET_SECONDS = 15 * 60
+
+
+def _window_start(rows: List[Dict[str, Any]], since: datetime) -> int:
+    """
+    Index of the first row at or after since in an oldest-first result page.
+
+    Pages requested with sort="asc" are ordered by block, so rows older than
+    the window are skipped with a binary search instead of being parsed.
+
+    Args:
+        rows: Explorer result rows in ascending timestamp order
+        since: Start of the window
+
+    Returns:
+        Index of the first row inside the window (len(rows) if none are)
+    """
+    return bisect_left(
+        rows, since.timestamp(), key=lambda row: int(row.get("timeStamp") or 0)
+    )
 
 
 class ActivityService:
@@ -20,7 +45,7 @@ class ActivityService:
     async def get_wallet_creation_date(self, address: str) -> Optional[datetime]:
         """Get the wallet creation date (first transaction) using Etherscan data."""
         try:
-            response = self.etherscan_adapter.get_normal_transactions(
+            response = await self.etherscan_adapter.get_normal_transactions(
                 address, page=1, offset=10000, sort="asc"
             )
             if not response or not self.etherscan_adapter.validate_response(response):
@@ -44,26 +69,36 @@ class ActivityService:
         try:
             since_date = datetime.now() - timedelta(days=days)
 
-            response = self.etherscan_adapter.get_normal_transactions(
-                address, page=1, offset=10000
+            # Same oldest-first page as get_wallet_creation_date, so the two
+            # share one cached response; only rows in the window are parsed
+            response = await self.etherscan_adapter.get_normal_transactions(
+                address, page=1, offset=10000, sort="asc"
             )
             if not response or not self.etherscan_adapter.validate_response(response):
                 return {"active_days": 0, "total_transactions": 0}
 
             transactions = response.get("result", [])
-            active_days = set()
-            total_transactions = 0
+            start = _window_start(transactions, since_date)
+            recent = np.fromiter(
+                (
+                    int(tx["timeStamp"])
+                    for tx in transactions[start:]
+                    if tx.get("timeStamp")
+                ),
+                dtype=np.int64,
+            )
 
-            for tx in transactions:
-                if tx.get("timeStamp"):
-                    tx_date = datetime.fromtimestamp(int(tx["timeStamp"]))
-                    if tx_date >= since_date:
-                        active_days.add(tx_date.date())
-                        total_transactions += 1
+            # Convert each distinct quarter-hour bucket to a local date rather
+            # than every transaction
+            buckets = np.unique(recent // _LOCAL_DAY_BUCKET_SECONDS)
+            active_days = {
+                datetime.fromtimestamp(int(bucket) * _LOCAL_DAY_BUCKET_SECONDS).date()
+                for bucket in buckets
+            }
 
             return {
                 "active_days": len(active_days),
-                "total_transactions": total_transactions,
+                "total_transactions": int(recent.size),
             }
 
         except Exception as e:
@@ -77,35 +112,40 @@ class ActivityService:
         try:
             since_date = datetime.now() - timedelta(days=days)
 
-            response = self.etherscan_adapter.get_erc20_token_transfers(
-                address, page=1, offset=10000
+            # Oldest-first page, shared with the portfolio holdings lookups;
+            # transfers before the window are skipped without being parsed
+            response = await self.etherscan_adapter.get_erc20_token_transfers(
+                address, page=1, offset=10000, sort="asc"
             )
             if not response or not self.etherscan_adapter.validate_response(response):
                 return {"swap_count": 0, "unique_tokens": 0, "dex_interactions": 0}
 
             transfers = response.get("result", [])
-            tx_transfers = defaultdict(list)
+            window = [
+                transfer
+                for transfer in transfers[_window_start(transfers, since_date) :]
+                if transfer.get("timeStamp") and transfer.get("hash")
+            ]
+
+            # Number each distinct tx hash and token in first-seen order; a tx
+            # moving two or more transfers counts as a swap
+            tx_ids = {}
+            tx_index = []
             unique_tokens = set()
-            swap_count = 0
-
-            for transfer in transfers:
-                if transfer.get("timeStamp"):
-                    transfer_date = datetime.fromtimestamp(int(transfer["timeStamp"]))
-                    if transfer_date >= since_date:
-                        tx_hash = transfer.get("hash")
-                        if tx_hash:
-                            tx_transfers[tx_hash].append(transfer)
-                            if transfer.get("contractAddress"):
-                                unique_tokens.add(transfer["contractAddress"].lower())
-
-            for tx_hash, tx_transfer_list in tx_transfers.items():
-                if len(tx_transfer_list) >= 2:
-                    swap_count += 1
+            for transfer in window:
+                tx_index.append(tx_ids.setdefault(transfer["hash"], len(tx_ids)))
+                if transfer.get("contractAddress"):
+                    unique_tokens.add(transfer["contractAddress"].lower())
+
+            transfers_per_tx = np.bincount(
+                np.array(tx_index, dtype=np.int64), minlength=len(tx_ids)
+            )
+            swap_count = int(np.count_nonzero(transfers_per_tx >= 2))
 
             return {
                 "swap_count": swap_count,
                 "unique_tokens": len(unique_tokens),
-                "dex_interactions": len(tx_transfers),
+                "dex_interactions": len(tx_ids),
             }
 
         except Exception as e:
@@ -5,106 +5,184 @@ This service handles portfolio data collection from various sources including
 Zerion and Etherscan, token/NFT holdings analysis, and portfolio composition.
 """
 
+import asyncio
 import aiohttp
 from datetime import datetime
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, Iterable, List, Optional, Tuple
 from collections import defaultdict
+from itertools import chain
 
+import numpy as np
+from cachetools import TTLCache
+
+from adapters.async_base import AsyncBaseAdapter
 from models.portfolio_models import TokenHolding, NFTHolding, PortfolioSnapshot
 from services.pricing_service import PricingService
 
 
+# Known Base chain token contracts, used to label Etherscan fallback holdings
+_KNOWN_BASE_TOKENS: Dict[str, dict] = {
+    "0x833589fcd6edb6e08f4c7c32d4f71b54bda02913": {
+        "symbol": "USDC",
+        "decimals": 6,
+    },
+    "0x4200000000000000000000000000000000000006": {
+        "symbol": "WETH",
+        "decimals": 18,
+    },
+    "0x50c5725949a6f0c72e6c4a641f24049a917db0cb": {
+        "symbol": "DAI",
+        "decimals": 18,
+    },
+    "0xd9aaec86b65d86f6a7b5b1b0c42ffa531710b6ca": {
+        "symbol": "USDbC",
+        "decimals": 6,
+    },
+}
+
+
+def _group_by_contract(transfers: Iterable[Dict]) -> Dict[str, List[Dict]]:
+    """Group token transfers by lowercased contract address, in input order."""
+    contract_transfers = defaultdict(list)
+    for transfer in transfers:
+        if transfer.get("contractAddress"):
+            contract_transfers[transfer["contractAddress"].lower()].append(transfer)
+    return contract_transfers
+
+
+def _transfer_value(transfer: Dict) -> float:
+    """Raw transfer amount, or 0.0 when the value is missing or malformed."""
+    try:
+        return float(transfer.get("value", "0"))
+    except (ValueError, TypeError):
+        return 0.0
+
+
+def _transfer_direction(transfer: Dict, address_lower: str) -> float:
+    """1.0 for a transfer into address, -1.0 for one out of it, else 0.0."""
+    if transfer.get("to", "").lower() == address_lower:
+        return 1.0
+    if transfer.get("from", "").lower() == address_lower:
+        return -1.0
+    return 0.0
+
+
 class PortfolioService:
     """Service for fetching and analyzing wallet portfolios."""
 
-    def __init__(self, etherscan_adapter, zerion_adapter=None):
-        """Initialize with EtherscanAdapter and optional ZerionAdapter."""
+    # ERC20 transfers grouped by contract are reused per address for
+    # TRANSFER_INDEX_TTL seconds (token balances and holding periods)
+    TRANSFER_INDEX_CACHE_SIZE = 256
+    TRANSFER_INDEX_TTL = 60
+
+    # Request timeout for the session this service opens when none is provided
+    # (its pool uses the adapters' settings)
+    REQUEST_TIMEOUT = 30
+
+    def __init__(
+        self,
+        etherscan_adapter,
+        zerion_adapter=None,
+        session: Optional[aiohttp.ClientSession] = None,
+    ):
+        """Initialize with EtherscanAdapter, optional ZerionAdapter and session."""
         self.etherscan_adapter = etherscan_adapter
         self.zerion_adapter = zerion_adapter
-        self.session: Optional[aiohttp.ClientSession] = None
-        self.pricing_service: Optional[PricingService] = None
+        self.session = session
+        self._own_session = session is None
+        # Kept for the service's lifetime so its price cache survives session
+        # changes; it is pointed at whichever session this service uses
+        self.pricing_service = PricingService(session)
+        self._erc20_index: TTLCache = TTLCache(
+            maxsize=self.TRANSFER_INDEX_CACHE_SIZE, ttl=self.TRANSFER_INDEX_TTL
+        )
+
+    def use_session(self, session: aiohttp.ClientSession) -> None:
+        """Use an externally managed session (not closed by this service)."""
+        self.session = session
+        self._own_session = False
+        self.pricing_service.use_session(session)
+
+    def _ensure_session(self) -> aiohttp.ClientSession:
+        """
+        Open this service's own pooled session if it has none.
+
+        The session is kept across analyses so keep-alive connections are
+        reused; it is closed by aclose() or on context manager exit.
+        """
+        if self.session is None or self.session.closed:
+            self.session = aiohttp.ClientSession(
+                connector=AsyncBaseAdapter.create_connector(),
+                timeout=aiohttp.ClientTimeout(total=self.REQUEST_TIMEOUT),
+            )
+            self._own_session = True
+            self.pricing_service.use_session(self.session)
+        return self.session
+
+    async def aclose(self) -> None:
+        """Close the session if this service opened it."""
+        if self._own_session and self.session:
+            await self.session.close()
+            self.session = None
 
     async def __aenter__(self):
         """Async context manager entry."""
-        self.session = aiohttp.ClientSession()
-        self.pricing_service = PricingService(self.session)
+        self._ensure_session()
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         """Async context manager exit."""
-        if self.session:
-            await self.session.close()
+        await self.aclose()
 
     async def analyze_portfolio(self, address: str) -> PortfolioSnapshot:
-        """Analyze a wallet's complete portfolio using Zerion and Etherscan data."""
-        print(f"Analyzing portfolio for: {address}")
+        """
+        Analyze a wallet's complete portfolio using Zerion and Etherscan data.
 
-        # Initialize session if not in context manager
-        if not self.session:
-            self.session = aiohttp.ClientSession()
-            self.pricing_service = PricingService(self.session)
+        Outside a context manager a pooled session is opened on first use and
+        kept for later analyses; call aclose() when done.
+        """
+        print(f"Analyzing portfolio for: {address}")
 
-        try:
-            # Get portfolio data from Zerion if available
-            if self.zerion_adapter:
-                token_holdings, nft_holdings, eth_balance, eth_value_usd = (
-                    await self._get_zerion_portfolio_data(address)
-                )
-            else:
-                # Fallback to Etherscan-based analysis
-                token_holdings = await self._get_token_holdings_etherscan(address)
-                nft_holdings = await self._get_nft_holdings_etherscan(address)
-                eth_balance = await self._get_eth_balance(address)
-
-                # Get ETH price
-                eth_price = await self.pricing_service.get_eth_price()
-                eth_value_usd = eth_balance * eth_price
-
-                # Get token prices for Etherscan-based holdings
-                token_addresses = [
-                    holding.contract_address for holding in token_holdings
-                ]
-                if token_addresses:
-                    token_prices = await self.pricing_service.get_token_prices(
-                        token_addresses
-                    )
-                    for holding in token_holdings:
-                        price = token_prices.get(holding.contract_address.lower(), 0.0)
-                        holding.price_usd = price
-                        holding.value_usd = holding.balance * price
-
-            # Enhance token holdings with acquisition dates from Etherscan
-            await self._enhance_holdings_with_acquisition_dates(
-                address, token_holdings, nft_holdings
-            )
+        self._ensure_session()
 
-            # Print detailed portfolio breakdown
-            await self._print_portfolio_breakdown(
-                address, token_holdings, nft_holdings, eth_balance, eth_value_usd
-            )
+        # One reference time for every holding period in this snapshot
+        now = datetime.now()
 
-            # Calculate total portfolio value
-            total_token_value = sum(holding.value_usd for holding in token_holdings)
-            total_nft_value = sum(
-                holding.estimated_value_usd for holding in nft_holdings
+        # Get portfolio data from Zerion if available
+        if self.zerion_adapter:
+            token_holdings, nft_holdings, eth_balance, eth_value_usd = (
+                await self._get_zerion_portfolio_data(address)
             )
-            total_value_usd = eth_value_usd + total_token_value + total_nft_value
-
-            return PortfolioSnapshot(
-                address=address,
-                eth_balance=eth_balance,
-                eth_value_usd=eth_value_usd,
-                token_holdings=token_holdings,
-                nft_holdings=nft_holdings,
-                total_value_usd=total_value_usd,
-                analysis_timestamp=datetime.now(),
+        else:
+            # Fallback to Etherscan-based analysis
+            token_holdings, nft_holdings, eth_balance, eth_value_usd = (
+                await self._get_etherscan_fallback_data(address, now)
             )
 
-        finally:
-            # Only close session if we created it ourselves
-            if self.session and not hasattr(self, "_context_managed"):
-                await self.session.close()
-                self.session = None
+        # Enhance token holdings with acquisition dates from Etherscan
+        await self._enhance_holdings_with_acquisition_dates(
+            address, token_holdings, nft_holdings, now
+        )
+
+        # Print detailed portfolio breakdown
+        await self._print_portfolio_breakdown(
+            address, token_holdings, nft_holdings, eth_balance, eth_value_usd
+        )
+
+        # Calculate total portfolio value
+        total_token_value = sum(holding.value_usd for holding in token_holdings)
+        total_nft_value = sum(holding.estimated_value_usd for holding in nft_holdings)
+        total_value_usd = eth_value_usd + total_token_value + total_nft_value
+
+        return PortfolioSnapshot(
+            address=address,
+            eth_balance=eth_balance,
+            eth_value_usd=eth_value_usd,
+            token_holdings=token_holdings,
+            nft_holdings=nft_holdings,
+            total_value_usd=total_value_usd,
+            analysis_timestamp=now,
+        )
 
     async def _print_portfolio_breakdown(
         self,
@@ -368,11 +446,17 @@ class PortfolioService:
         eth_value_usd = 0.0
 
         try:
-            # Get fungible positions from Zerion
-            positions_response = self.zerion_adapter.get_wallet_positions(
-                address,
-                currency="usd",
-                **{"filter[chain_ids]": "base,ethereum", "page[size]": "100"},
+            # Get fungible positions and NFT collections from Zerion concurrently
+            positions_response, nft_response = await asyncio.gather(
+                self.zerion_adapter.get_wallet_positions(
+                    address,
+                    currency="usd",
+                    **{"filter[chain_ids]": "base,ethereum", "page[size]": "100"},
+                ),
+                self.zerion_adapter.get_wallet_nft_collections(
+                    address,
+                    **{"filter[chain_ids]": "base,ethereum", "page[size]": "100"},
+                ),
             )
 
             if positions_response and positions_response.get("data"):
@@ -419,7 +503,7 @@ class PortfolioService:
                         if contract_address and balance > 0:
                             token_holdings.append(
                                 TokenHolding(
-                                    contract_address=contract_address.lower(),
+                                    contract_address=contract_address,
                                     symbol=symbol,
                                     balance=balance,
                                     decimals=decimals,
@@ -431,11 +515,6 @@ class PortfolioService:
                         print(f"Error processing position: {position_error}")
                         continue
 
-            # Get NFT collections from Zerion
-            nft_response = self.zerion_adapter.get_wallet_nft_collections(
-                address, **{"filter[chain_ids]": "base,ethereum", "page[size]": "100"}
-            )
-
             if nft_response and nft_response.get("data"):
                 for collection in nft_response["data"]:
                     try:
@@ -512,14 +591,16 @@ class PortfolioService:
         return token_holdings, nft_holdings, eth_balance, eth_value_usd
 
     async def _get_etherscan_fallback_data(
-        self, address: str
+        self, address: str, now: Optional[datetime] = None
     ) -> Tuple[List[TokenHolding], List[NFTHolding], float, float]:
         """Fallback to Etherscan-based portfolio analysis."""
-        token_holdings = await self._get_token_holdings_etherscan(address)
-        nft_holdings = await self._get_nft_holdings_etherscan(address)
-        eth_balance = await self._get_eth_balance(address)
-
-        eth_price = await self.pricing_service.get_eth_price()
+        # The holdings, balance and ETH price lookups are independent
+        token_holdings, nft_holdings, eth_balance, eth_price = await asyncio.gather(
+            self._get_token_holdings_etherscan(address),
+            self._get_nft_holdings_etherscan(address, now),
+            self._get_eth_balance(address),
+            self.pricing_service.get_eth_price(),
+        )
         eth_value_usd = eth_balance * eth_price
 
         # Get token prices
@@ -527,7 +608,7 @@ class PortfolioService:
         if token_addresses:
             token_prices = await self.pricing_service.get_token_prices(token_addresses)
             for holding in token_holdings:
-                price = token_prices.get(holding.contract_address.lower(), 0.0)
+                price = token_prices.get(holding.contract_address, 0.0)
                 holding.price_usd = price
                 holding.value_usd = holding.balance * price
 
@@ -538,25 +619,32 @@ class PortfolioService:
         address: str,
         token_holdings: List[TokenHolding],
         nft_holdings: List[NFTHolding],
+        now: Optional[datetime] = None,
     ):
         """Enhanced holdings with detailed acquisition dates and holding periods from Etherscan."""
         print("🔍 Calculating holding periods from on-chain activities...")
 
+        # Every holding period is measured against the same reference time
+        now = now or datetime.now()
+
         try:
             # Enhanced ERC20 token analysis
-            await self._analyze_erc20_holding_periods(address, token_holdings)
+            await self._analyze_erc20_holding_periods(address, token_holdings, now)
 
             # Enhanced ERC721 NFT analysis
-            await self._analyze_erc721_holding_periods(address, nft_holdings)
+            await self._analyze_erc721_holding_periods(address, nft_holdings, now)
 
             # Also analyze ERC1155 tokens if any
-            await self._analyze_erc1155_holding_periods(address, nft_holdings)
+            await self._analyze_erc1155_holding_periods(address, nft_holdings, now)
 
         except Exception as e:
             print(f"Error enhancing holdings with acquisition dates: {e}")
 
     async def _analyze_erc20_holding_periods(
-        self, address: str, token_holdings: List[TokenHolding]
+        self,
+        address: str,
+        token_holdings: List[TokenHolding],
+        now: Optional[datetime] = None,
     ):
         """Analyze ERC20 token holding periods with detailed transaction history from multiple chains."""
         try:
@@ -567,13 +655,14 @@ class PortfolioService:
             if hasattr(self.etherscan_adapter, "get_erc20_token_transfers_all_chains"):
                 # Multi-chain adapter - get data from all chains
                 all_chains_response = (
-                    self.etherscan_adapter.get_erc20_token_transfers_all_chains(
+                    await self.etherscan_adapter.get_erc20_token_transfers_all_chains(
                         address, page=1, offset=10000
                     )
                 )
 
-                # Aggregate transfers from all chains
-                all_transfers = []
+                # Keep each chain's transfers and iterate them in sequence, rather
+                # than copying them all into one combined list
+                chain_results = []
                 for chain_id, chain_response in all_chains_response.items():
                     if chain_response and self.etherscan_adapter.validate_response(
                         chain_response
@@ -582,7 +671,7 @@ class PortfolioService:
                         # Add chain_id to each transfer for tracking
                         for transfer in chain_transfers:
                             transfer["source_chain_id"] = chain_id
-                        all_transfers.extend(chain_transfers)
+                        chain_results.append(chain_transfers)
                         chain_name = getattr(
                             self.etherscan_adapter, "chain_names", {}
                         ).get(chain_id, f"Chain {chain_id}")
@@ -593,35 +682,30 @@ class PortfolioService:
                         ).get(chain_id, f"Chain {chain_id}")
                         print(f"   ❌ {chain_name}: Failed to fetch transfers")
 
-                print(
-                    f"📊 Total ERC20 transfers across all chains: {len(all_transfers)}"
+                transfer_count = sum(map(len, chain_results))
+                print(f"📊 Total ERC20 transfers across all chains: {transfer_count}")
+
+                # Group transfers by contract address
+                contract_transfers = _group_by_contract(
+                    chain.from_iterable(chain_results)
                 )
 
             else:
-                # Fallback to single-chain adapter
-                token_response = self.etherscan_adapter.get_erc20_token_transfers(
-                    address, page=1, offset=10000
+                # Fallback to single-chain adapter, reusing the grouping made
+                # when the token balances were derived
+                contract_transfers = await self._get_erc20_transfers_by_contract(
+                    address
                 )
-
-                if not token_response or not self.etherscan_adapter.validate_response(
-                    token_response
-                ):
+                if contract_transfers is None:
                     print("⚠️  Could not fetch ERC20 transfer history")
                     return
 
-                all_transfers = token_response.get("result", [])
-                print(f"📊 Analyzing {len(all_transfers)} ERC20 transfers...")
-
-            # Group transfers by contract address
-            contract_transfers = defaultdict(list)
-            for transfer in all_transfers:
-                if transfer.get("contractAddress"):
-                    contract_addr = transfer["contractAddress"].lower()
-                    contract_transfers[contract_addr].append(transfer)
+                transfer_count = sum(map(len, contract_transfers.values()))
+                print(f"📊 Analyzing {transfer_count} ERC20 transfers...")
 
             # Analyze each token holding
             for holding in token_holdings:
-                contract_addr = holding.contract_address.lower()
+                contract_addr = holding.contract_address
                 transfers_for_token = contract_transfers.get(contract_addr, [])
 
                 if not transfers_for_token:
@@ -632,7 +716,7 @@ class PortfolioService:
 
                 # Calculate detailed holding metrics
                 holding_analysis = self._calculate_detailed_holding_metrics(
-                    address, transfers_for_token, "ERC20"
+                    address, transfers_for_token, "ERC20", now
                 )
 
                 # Update holding with calculated metrics
@@ -663,7 +747,10 @@ class PortfolioService:
             print(f"Error analyzing ERC20 holding periods: {e}")
 
     async def _analyze_erc721_holding_periods(
-        self, address: str, nft_holdings: List[NFTHolding]
+        self,
+        address: str,
+        nft_holdings: List[NFTHolding],
+        now: Optional[datetime] = None,
     ):
         """Analyze ERC721 NFT holding periods with detailed transaction history from multiple chains."""
         try:
@@ -674,13 +761,14 @@ class PortfolioService:
             if hasattr(self.etherscan_adapter, "get_erc721_token_transfers_all_chains"):
                 # Multi-chain adapter - get data from all chains
                 all_chains_response = (
-                    self.etherscan_adapter.get_erc721_token_transfers_all_chains(
+                    await self.etherscan_adapter.get_erc721_token_transfers_all_chains(
                         address, page=1, offset=1000
                     )
                 )
 
-                # Aggregate transfers from all chains
-                all_transfers = []
+                # Keep each chain's transfers and iterate them in sequence, rather
+                # than copying them all into one combined list
+                chain_results = []
                 for chain_id, chain_response in all_chains_response.items():
                     if chain_response and self.etherscan_adapter.validate_response(
                         chain_response
@@ -689,7 +777,7 @@ class PortfolioService:
                         # Add chain_id to each transfer for tracking
                         for transfer in chain_transfers:
                             transfer["source_chain_id"] = chain_id
-                        all_transfers.extend(chain_transfers)
+                        chain_results.append(chain_transfers)
                         chain_name = getattr(
                             self.etherscan_adapter, "chain_names", {}
                         ).get(chain_id, f"Chain {chain_id}")
@@ -700,13 +788,13 @@ class PortfolioService:
                         ).get(chain_id, f"Chain {chain_id}")
                         print(f"   ❌ {chain_name}: Failed to fetch transfers")
 
-                print(
-                    f"🖼️  Total ERC721 transfers across all chains: {len(all_transfers)}"
-                )
+                transfer_count = sum(map(len, chain_results))
+                all_transfers = chain.from_iterable(chain_results)
+                print(f"🖼️  Total ERC721 transfers across all chains: {transfer_count}")
 
             else:
                 # Fallback to single-chain adapter
-                nft_response = self.etherscan_adapter.get_erc721_token_transfers(
+                nft_response = await self.etherscan_adapter.get_erc721_token_transfers(
                     address, page=1, offset=1000
                 )
 
@@ -719,9 +807,12 @@ class PortfolioService:
                 all_transfers = nft_response.get("result", [])
                 print(f"🖼️  Analyzing {len(all_transfers)} ERC721 transfers...")
 
-            # Group transfers by contract address and token ID
+            # Group transfers by contract address and token ID, tracking each
+            # collection's earliest incoming transfer as a running minimum
             nft_transfers = defaultdict(list)
             collection_transfers = defaultdict(list)
+            earliest_acquisitions = {}
+            address_lower = address.lower()
 
             for transfer in all_transfers:
                 if transfer.get("contractAddress"):
@@ -735,9 +826,16 @@ class PortfolioService:
                     # Group by collection
                     collection_transfers[contract_addr].append(transfer)
 
-            # Analyze each NFT holding
+                    if transfer.get("to", "").lower() == address_lower:
+                        timestamp = int(transfer.get("timeStamp", "0"))
+                        earliest = earliest_acquisitions.get(contract_addr)
+                        if earliest is None or timestamp < earliest:
+                            earliest_acquisitions[contract_addr] = timestamp
+
+            # Analyze each NFT holding against a single reference time
+            now = now or datetime.now()
             for holding in nft_holdings:
-                contract_addr = holding.contract_address.lower()
+                contract_addr = holding.contract_address
 
                 # For individual NFTs
                 if hasattr(holding, "token_id") and holding.token_id:
@@ -749,7 +847,7 @@ class PortfolioService:
                             key=lambda x: int(x.get("timeStamp", "0"))
                         )
                         holding_analysis = self._calculate_detailed_holding_metrics(
-                            address, transfers_for_nft, "ERC721"
+                            address, transfers_for_nft, "ERC721", now
                         )
 
                         holding.acquisition_date = holding_analysis["first_acquisition"]
@@ -763,26 +861,13 @@ class PortfolioService:
                         contract_addr, []
                     )
                     if collection_transfers_list:
-                        collection_transfers_list.sort(
-                            key=lambda x: int(x.get("timeStamp", "0"))
-                        )
+                        # Earliest acquisition for this collection
+                        earliest = earliest_acquisitions.get(contract_addr)
 
-                        # Find earliest acquisition for this collection
-                        acquisitions = [
-                            t
-                            for t in collection_transfers_list
-                            if t.get("to", "").lower() == address.lower()
-                        ]
-
-                        if acquisitions:
-                            earliest_acquisition = min(
-                                acquisitions, key=lambda x: int(x.get("timeStamp", "0"))
-                            )
-                            holding.acquisition_date = datetime.fromtimestamp(
-                                int(earliest_acquisition["timeStamp"])
-                            )
+                        if earliest is not None:
+                            holding.acquisition_date = datetime.fromtimestamp(earliest)
                             holding.holding_period_days = (
-                                datetime.now() - holding.acquisition_date
+                                now - holding.acquisition_date
                             ).days
 
                             # Log which chains this collection was active on
@@ -808,7 +893,10 @@ class PortfolioService:
             print(f"Error analyzing ERC721 holding periods: {e}")
 
     async def _analyze_erc1155_holding_periods(
-        self, address: str, nft_holdings: List[NFTHolding]
+        self,
+        address: str,
+        nft_holdings: List[NFTHolding],
+        now: Optional[datetime] = None,
     ):
         """Analyze ERC1155 token holding periods from multiple chains."""
         try:
@@ -821,13 +909,14 @@ class PortfolioService:
             ):
                 # Multi-chain adapter - get data from all chains
                 all_chains_response = (
-                    self.etherscan_adapter.get_erc1155_token_transfers_all_chains(
+                    await self.etherscan_adapter.get_erc1155_token_transfers_all_chains(
                         address, page=1, offset=1000
                     )
                 )
 
-                # Aggregate transfers from all chains
-                all_transfers = []
+                # Keep each chain's transfers and iterate them in sequence, rather
+                # than copying them all into one combined list
+                chain_results = []
                 for chain_id, chain_response in all_chains_response.items():
                     if chain_response and self.etherscan_adapter.validate_response(
                         chain_response
@@ -836,7 +925,7 @@ class PortfolioService:
                         # Add chain_id to each transfer for tracking
                         for transfer in chain_transfers:
                             transfer["source_chain_id"] = chain_id
-                        all_transfers.extend(chain_transfers)
+                        chain_results.append(chain_transfers)
                         chain_name = getattr(
                             self.etherscan_adapter, "chain_names", {}
                         ).get(chain_id, f"Chain {chain_id}")
@@ -853,15 +942,19 @@ class PortfolioService:
                         ):  # Only log if there was actually an error
                             print(f"   ❌ {chain_name}: Failed to fetch transfers")
 
-                if all_transfers:
+                transfer_count = sum(map(len, chain_results))
+                all_transfers = chain.from_iterable(chain_results)
+                if transfer_count:
                     print(
-                        f"🎨 Total ERC1155 transfers across all chains: {len(all_transfers)}"
+                        f"🎨 Total ERC1155 transfers across all chains: {transfer_count}"
                     )
 
             else:
                 # Fallback to single-chain adapter
-                erc1155_response = self.etherscan_adapter.get_erc1155_token_transfers(
-                    address, page=1, offset=1000
+                erc1155_response = (
+                    await self.etherscan_adapter.get_erc1155_token_transfers(
+                        address, page=1, offset=1000
+                    )
                 )
 
                 if (
@@ -871,10 +964,11 @@ class PortfolioService:
                     return
 
                 all_transfers = erc1155_response.get("result", [])
-                if all_transfers:
-                    print(f"🎨 Analyzing {len(all_transfers)} ERC1155 transfers...")
+                transfer_count = len(all_transfers)
+                if transfer_count:
+                    print(f"🎨 Analyzing {transfer_count} ERC1155 transfers...")
 
-            if not all_transfers:
+            if not transfer_count:
                 return
 
             # Group transfers by contract address and token ID
@@ -888,6 +982,14 @@ class PortfolioService:
                     nft_key = (contract_addr, token_id)
                     erc1155_transfers[nft_key].append(transfer)
 
+            # Existing holdings by (contract, token ID), first match kept
+            address_lower = address.lower()
+            holdings_by_key = {}
+            for holding in nft_holdings:
+                holdings_by_key.setdefault(
+                    (holding.contract_address, str(holding.token_id)), holding
+                )
+
             # Update existing NFT holdings or create new ones for ERC1155
             for (contract_addr, token_id), transfers_list in erc1155_transfers.items():
                 transfers_list.sort(key=lambda x: int(x.get("timeStamp", "0")))
@@ -896,21 +998,13 @@ class PortfolioService:
                 latest_transfer = max(
                     transfers_list, key=lambda x: int(x.get("timeStamp", "0"))
                 )
-                if latest_transfer.get("to", "").lower() == address.lower():
+                if latest_transfer.get("to", "").lower() == address_lower:
                     holding_analysis = self._calculate_detailed_holding_metrics(
-                        address, transfers_list, "ERC1155"
+                        address, transfers_list, "ERC1155", now
                     )
 
                     # Find existing holding or create new one
-                    existing_holding = None
-                    for holding in nft_holdings:
-                        if (
-                            holding.contract_address.lower() == contract_addr
-                            and hasattr(holding, "token_id")
-                            and str(holding.token_id) == token_id
-                        ):
-                            existing_holding = holding
-                            break
+                    existing_holding = holdings_by_key.get((contract_addr, token_id))
 
                     if existing_holding:
                         existing_holding.acquisition_date = holding_analysis[
@@ -943,7 +1037,11 @@ class PortfolioService:
             print(f"Error analyzing ERC1155 holding periods: {e}")
 
     def _calculate_detailed_holding_metrics(
-        self, address: str, transfers: List[Dict], token_type: str
+        self,
+        address: str,
+        transfers: List[Dict],
+        token_type: str,
+        now: Optional[datetime] = None,
     ) -> Dict:
         """Calculate detailed holding metrics from transfer history."""
         address_lower = address.lower()
@@ -1016,7 +1114,7 @@ class PortfolioService:
             # Calculate holding period from first acquisition to now
             if metrics["first_acquisition"]:
                 metrics["holding_period_days"] = (
-                    datetime.now() - metrics["first_acquisition"]
+                    (now or datetime.now()) - metrics["first_acquisition"]
                 ).days
 
         metrics["current_balance"] = max(0, current_balance)
@@ -1026,7 +1124,10 @@ class PortfolioService:
     async def _get_eth_balance(self, address: str) -> float:
         """Get ETH balance for an address."""
         try:
-            response = self.etherscan_adapter.get_ether_balance(address)
+            # Concurrent analyses share one balancemulti call
+            response = await self.etherscan_adapter.get_ether_balance_coalesced(
+                address
+            )
             if response and self.etherscan_adapter.validate_response(response):
                 balance_wei = int(response.get("result", "0"))
                 return balance_wei / 1e18
@@ -1038,49 +1139,18 @@ class PortfolioService:
         """Get token holdings using Etherscan (fallback method)."""
         holdings = []
 
-        # Known Base chain token contracts
-        known_tokens = {
-            "0x833589fcd6edb6e08f4c7c32d4f71b54bda02913": {
-                "symbol": "USDC",
-                "decimals": 6,
-            },
-            "0x4200000000000000000000000000000000000006": {
-                "symbol": "WETH",
-                "decimals": 18,
-            },
-            "0x50c5725949a6f0c72e6c4a641f24049a917db0cb": {
-                "symbol": "DAI",
-                "decimals": 18,
-            },
-            "0xd9aaec86b65d86f6a7b5b1b0c42ffa531710b6ca": {
-                "symbol": "USDbC",
-                "decimals": 6,
-            },
-        }
-
         try:
-            response = self.etherscan_adapter.get_erc20_token_transfers(
-                address, page=1, offset=10000
-            )
-            if not response or not self.etherscan_adapter.validate_response(response):
+            token_transfers = await self._get_erc20_transfers_by_contract(address)
+            if token_transfers is None:
                 return holdings
 
-            transfers = response.get("result", [])
-            token_transfers = defaultdict(list)
-
-            for transfer in transfers:
-                if transfer.get("contractAddress"):
-                    token_transfers[transfer["contractAddress"].lower()].append(
-                        transfer
-                    )
-
             for contract_address, token_transfers_list in token_transfers.items():
                 balance = await self._calculate_token_balance(
                     address, contract_address, token_transfers_list
                 )
 
                 if balance > 0:
-                    token_info = known_tokens.get(contract_address, {})
+                    token_info = _KNOWN_BASE_TOKENS.get(contract_address, {})
                     symbol = token_info.get("symbol", f"TOKEN-{contract_address[:6]}")
                     decimals = token_info.get("decimals", 18)
                     actual_balance = balance / (10**decimals)
@@ -1101,59 +1171,88 @@ class PortfolioService:
 
         return holdings
 
+    async def _get_erc20_transfers_by_contract(
+        self, address: str
+    ) -> Optional[Dict[str, List[Dict]]]:
+        """
+        Get an address's ERC20 transfers grouped by lowercased contract address.
+
+        The transfer page is grouped once and cached per address for
+        TRANSFER_INDEX_TTL seconds, so token balances and holding periods
+        share the same index instead of each regrouping the page.
+
+        Args:
+            address: Wallet address to look up
+
+        Returns:
+            Mapping of contract address to its transfers, or None if the
+            transfer history could not be fetched
+        """
+        key = address.lower()
+        contract_transfers = self._erc20_index.get(key)
+        if contract_transfers is not None:
+            return contract_transfers
+
+        response = await self.etherscan_adapter.get_erc20_token_transfers(
+            address, page=1, offset=10000
+        )
+        if not response or not self.etherscan_adapter.validate_response(response):
+            return None
+
+        contract_transfers = _group_by_contract(response.get("result", []))
+        self._erc20_index[key] = contract_transfers
+        return contract_transfers
+
     async def _calculate_token_balance(
         self, address: str, contract_address: str, transfers: List[Dict]
     ) -> float:
         """Calculate current token balance from transfer history."""
-        balance = 0.0
-
-        for transfer in transfers:
-            try:
-                value = float(transfer.get("value", "0"))
-                from_addr = transfer.get("from", "").lower()
-                to_addr = transfer.get("to", "").lower()
-                address_lower = address.lower()
-
-                if to_addr == address_lower:
-                    balance += value
-                elif from_addr == address_lower:
-                    balance -= value
-            except (ValueError, TypeError):
-                continue
+        # Signed sum of the transfer values as one dot product
+        address_lower = address.lower()
+        values = np.fromiter(
+            map(_transfer_value, transfers), dtype=np.float64, count=len(transfers)
+        )
+        signs = np.fromiter(
+            (_transfer_direction(transfer, address_lower) for transfer in transfers),
+            dtype=np.float64,
+            count=len(transfers),
+        )
+        balance = float(np.vdot(signs, values))
 
         return max(0.0, balance)
 
-    async def _get_nft_holdings_etherscan(self, address: str) -> List[NFTHolding]:
+    async def _get_nft_holdings_etherscan(
+        self, address: str, now: Optional[datetime] = None
+    ) -> List[NFTHolding]:
         """Get NFT holdings using Etherscan (fallback method)."""
         holdings = []
 
         try:
-            response = self.etherscan_adapter.get_erc721_token_transfers(
+            response = await self.etherscan_adapter.get_erc721_token_transfers(
                 address, page=1, offset=1000
             )
             if not response or not self.etherscan_adapter.validate_response(response):
                 return holdings
 
             transfers = response.get("result", [])
-            nft_transfers = defaultdict(list)
+            # Latest transfer of each NFT as (timestamp, transfer), kept in a
+            # single pass; the earliest of equal timestamps wins
+            latest_transfers = {}
+            now = now or datetime.now()
+            address_lower = address.lower()
 
             for transfer in transfers:
                 if transfer.get("contractAddress") and transfer.get("tokenID"):
                     key = (transfer["contractAddress"].lower(), transfer["tokenID"])
-                    nft_transfers[key].append(transfer)
-
-            for (
-                contract_address,
-                token_id,
-            ), token_transfers_list in nft_transfers.items():
-                latest_transfer = max(
-                    token_transfers_list, key=lambda x: int(x.get("timeStamp", "0"))
-                )
-
-                if latest_transfer.get("to", "").lower() == address.lower():
-                    acquired_date = datetime.fromtimestamp(
-                        int(latest_transfer.get("timeStamp", "0"))
-                    )
+                    timestamp = int(transfer.get("timeStamp", "0"))
+                    latest = latest_transfers.get(key)
+                    if latest is None or timestamp > latest[0]:
+                        latest_transfers[key] = (timestamp, transfer)
+
+            for key, (timestamp, latest_transfer) in latest_transfers.items():
+                contract_address, token_id = key
+                if latest_transfer.get("to", "").lower() == address_lower:
+                    acquired_date = datetime.fromtimestamp(timestamp)
                     collection_name = latest_transfer.get(
                         "tokenName", f"Collection-{contract_address[:6]}"
                     )
@@ -1165,6 +1264,7 @@ class PortfolioService:
                             collection_name=collection_name,
                             estimated_value_usd=0.0,
                             acquired_date=acquired_date,
+                            now=now,
                         )
                     )
 
@@ -5,17 +5,39 @@ This service handles all price-related operations including token prices from De
 and ETH price fetching.
 """
 
+import asyncio
 import aiohttp
+import orjson
 from typing import Dict, List, Optional
 
+from cachetools import TTLCache
+
 
 class PricingService:
     """Service for fetching cryptocurrency and token prices."""
 
+    # Token prices are reused for PRICE_CACHE_TTL seconds, the ETH price for
+    # ETH_PRICE_TTL seconds
+    PRICE_CACHE_SIZE = 4096
+    PRICE_CACHE_TTL = 60
+    ETH_PRICE_TTL = 30
+
+    # Tokens requested per DeFiLlama call (keeps the URL within length limits)
+    PRICE_BATCH_SIZE = 100
+
     def __init__(self, session: Optional[aiohttp.ClientSession] = None):
         """Initialize with optional aiohttp session."""
         self.session = session
         self._own_session = session is None
+        self._price_cache: TTLCache = TTLCache(
+            maxsize=self.PRICE_CACHE_SIZE, ttl=self.PRICE_CACHE_TTL
+        )
+        self._eth_price_cache: TTLCache = TTLCache(maxsize=1, ttl=self.ETH_PRICE_TTL)
+
+    def use_session(self, session: aiohttp.ClientSession) -> None:
+        """Use an externally managed session (not closed by this service)."""
+        self.session = session
+        self._own_session = False
 
     async def __aenter__(self):
         """Async context manager entry."""
@@ -31,17 +53,56 @@ class PricingService:
     async def get_token_prices(
         self, token_addresses: List[str], chain: str = "base"
     ) -> Dict[str, float]:
-        """Get token prices from DeFiLlama API."""
+        """
+        Get token prices from DeFiLlama API.
+
+        Recently fetched prices are served from an in-process cache; the rest
+        are requested in batches of PRICE_BATCH_SIZE, concurrently.
+
+        Args:
+            token_addresses: Token contract addresses to price
+            chain: DeFiLlama chain name
+
+        Returns:
+            Mapping of lowercased token address to USD price, for the tokens
+            DeFiLlama has a price for
+        """
         if not self.session or not token_addresses:
             return {}
 
+        prices = {}
+        missing = []
+        for address in dict.fromkeys(addr.lower() for addr in token_addresses):
+            price = self._price_cache.get((chain, address))
+            if price is None:
+                missing.append(address)
+            else:
+                prices[address] = price
+
+        batches = [
+            missing[i : i + self.PRICE_BATCH_SIZE]
+            for i in range(0, len(missing), self.PRICE_BATCH_SIZE)
+        ]
+        for fetched in await asyncio.gather(
+            *(self._fetch_token_prices(batch, chain) for batch in batches)
+        ):
+            for address, price in fetched.items():
+                self._price_cache[(chain, address)] = price
+            prices.update(fetched)
+
+        return prices
+
+    async def _fetch_token_prices(
+        self, token_addresses: List[str], chain: str
+    ) -> Dict[str, float]:
+        """Request one batch of token prices from DeFiLlama."""
         try:
             addresses_str = ",".join([f"{chain}:{addr}" for addr in token_addresses])
             url = f"https://coins.llama.fi/prices/current/{addresses_str}"
 
             async with self.session.get(url) as response:
                 if response.status == 200:
-                    data = await response.json()
+                    data = orjson.loads(await response.read())
                     prices = {}
 
                     for key, value in data.get("coins", {}).items():
@@ -60,16 +121,23 @@ class PricingService:
         if not self.session:
             return 0.0
 
+        price = self._eth_price_cache.get("eth")
+        if price is not None:
+            return price
+
         try:
             url = "https://coins.llama.fi/prices/current/ethereum:0x0000000000000000000000000000000000000000"
             async with self.session.get(url) as response:
                 if response.status == 200:
-                    data = await response.json()
-                    return (
+                    data = orjson.loads(await response.read())
+                    price = (
                         data.get("coins", {})
                         .get("ethereum:0x0000000000000000000000000000000000000000", {})
                         .get("price", 0.0)
                     )
+                    if price:
+                        self._eth_price_cache["eth"] = price
+                    return price
         except Exception as e:
             print(f"Error fetching ETH price: {e}")
 
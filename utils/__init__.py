@@ -0,0 +1,8 @@
+"""
+Shared utilities for portfolio analysis.
+"""
+
+from .convert import parse_wei, safe_wei_to_eth, wei_to_eth, WEI_PER_ETH
+from .runtime import run
+
+__all__ = ["parse_wei", "safe_wei_to_eth", "wei_to_eth", "WEI_PER_ETH", "run"]
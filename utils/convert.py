@@ -0,0 +1,64 @@
+"""
+Unit conversion helpers.
+
+Vectorized conversions for the string-encoded integer amounts returned by
+blockchain explorer APIs.
+"""
+
+from typing import Any, Sequence
+
+import numpy as np
+
+WEI_PER_ETH = 1e18
+
+
+def parse_wei(value: Any) -> int:
+    """
+    Parse a wei amount, treating missing or malformed values as 0.
+
+    A single int() attempt replaces the isdigit()-then-int() double scan.
+
+    Args:
+        value: Wei amount as a decimal string (or int)
+
+    Returns:
+        Wei amount as an int
+    """
+    try:
+        return int(value)
+    except (ValueError, TypeError):
+        return 0
+
+
+def safe_wei_to_eth(value: Any) -> float:
+    """
+    Convert a single wei amount to ETH, treating malformed values as 0.
+
+    Args:
+        value: Wei amount as a decimal string (or int)
+
+    Returns:
+        ETH amount as a float
+    """
+    return parse_wei(value) / WEI_PER_ETH
+
+
+def wei_to_eth(values: Sequence[str]) -> np.ndarray:
+    """
+    Convert a batch of wei amounts (decimal strings) to ETH.
+
+    Malformed entries convert to 0. Amounts are parsed as Python ints and
+    stored as float64, since wei values routinely overflow int64.
+
+    Args:
+        values: Wei amounts as decimal strings
+
+    Returns:
+        float64 array of ETH amounts, one per input value
+    """
+    wei = np.fromiter(
+        (parse_wei(v) for v in values),
+        dtype=np.float64,
+        count=len(values),
+    )
+    return wei / WEI_PER_ETH
@@ -0,0 +1,31 @@
+"""
+Event loop helpers for the command-line entry points.
+"""
+
+import asyncio
+from typing import Any, Coroutine
+
+
+def run(main: Coroutine[Any, Any, Any]) -> Any:
+    """
+    Run a coroutine to completion, on uvloop when it is installed.
+
+    Args:
+        main: Coroutine to run
+
+    Returns:
+        The coroutine's result
+    """
+    try:
+        import uvloop
+    except ImportError:
+        return asyncio.run(main)
+
+    # asyncio.Runner (and its loop_factory) is new in Python 3.11; on older
+    # versions select uvloop through the event loop policy instead
+    if not hasattr(asyncio, "Runner"):
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+        return asyncio.run(main)
+
+    with asyncio.Runner(loop_factory=uvloop.new_event_loop) as runner:
+        return runner.run(main)